@@ -0,0 +1,177 @@
+"""
+Reading and writing pytest-benchmark result files without holding them in memory.
+
+iter_benchmarks() yields the benchmark records one at a time, from either
+- the JSON written by `pytest --benchmark-json` (parsed incrementally, record by record), or
+- the compact format written by convert() (`.jsonl.gz`): one benchmark per line with the per-round
+  timings (`stats.data`, the bulk of the JSON files) packed as base64 float32 under `stats.data_f32`,
+  everything else (machine_info, commit_info, datetime, version) on `{"header": {...}}` lines.
+
+Usage: python benchmark_results.py <benchmark_results.json> [<out.jsonl.gz>] [--drop-data]
+"""
+import base64
+import gzip
+import json
+from array import array
+from benchmarks.data_constants import DATA_SIZE_POINTS
+
+CHUNK_SIZE = 1 << 16
+COMPACT_SUFFIX = ".jsonl.gz"
+
+_decoder = json.JSONDecoder()
+
+class _Reader:
+    """Text buffer over a file, refilled on demand for raw_decode"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def fill(self):
+        # Read at least as much as is buffered, so retrying a long record stays linear
+        chunk = self.f.read(max(CHUNK_SIZE, len(self.buffer) - self.position))
+        if not chunk:
+            self.eof = True
+        # Drop what has been consumed so the buffer stays about one record long
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def peek(self):
+        """Next non whitespace character, '' at the end of the file"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position:self.position + 1]
+            self.fill()
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.position}, got {self.peek()!r}")
+        self.position += 1
+
+    def value(self):
+        """Decode the next JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.buffer) and not self.eof:
+                self.fill()
+                continue
+            self.position = end
+            return value
+
+def _iter_json(f, header=None):
+    """Benchmark records of a --benchmark-json file, other top level keys go into `header`"""
+    reader = _Reader(f)
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+        if key == "benchmarks":
+            reader.expect("[")
+            while reader.peek() != "]":
+                yield reader.value()
+                if reader.peek() == ",":
+                    reader.position += 1
+            reader.position += 1
+        elif header is not None:
+            header[key] = reader.value()
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.position += 1
+
+def pack_data(values):
+    return base64.b64encode(array("f", values).tobytes()).decode("ascii")
+
+def unpack_data(text):
+    values = array("f")
+    values.frombytes(base64.b64decode(text))
+    return values.tolist()
+
+def _iter_compact(f, header=None):
+    for line in f:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "header" in record:
+            if header is not None:
+                header.update(record["header"])
+            continue
+        stats = record.get("stats", {})
+        if "data_f32" in stats:
+            stats["data"] = unpack_data(stats.pop("data_f32"))
+        yield record
+
+def data_size_points(size):
+    """Number of points for a data size name or number, None when unknown"""
+    if size in DATA_SIZE_POINTS:
+        return DATA_SIZE_POINTS[size]
+    try:
+        return int(size)
+    except (TypeError, ValueError):
+        return None
+
+def iter_benchmarks(filename, header=None):
+    """
+    Yield the benchmark records of a result file one at a time. When `header` is a dict it is
+    filled with the other top level keys (machine_info, commit_info, datetime, version), it is
+    complete once the records are exhausted.
+    """
+    if filename.endswith(".gz"):
+        with gzip.open(filename, "rt", encoding="utf-8") as f:
+            yield from _iter_compact(f, header)
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            yield from _iter_json(f, header)
+
+def compact_name(filename):
+    base = filename[:-len(".json")] if filename.endswith(".json") else filename
+    return base + COMPACT_SUFFIX
+
+def convert(source, target=None, keep_data=True):
+    """Write `source` in the compact format, streaming, returns the target filename"""
+    target = target or compact_name(source)
+    header = {}
+    written = {}
+    with gzip.open(target, "wt", encoding="utf-8") as out:
+        for record in iter_benchmarks(source, header):
+            # Keys before "benchmarks" (machine_info, commit_info) go first, the rest at the end
+            if len(header) > len(written):
+                out.write(_header_line(header, written))
+            out.write(_compact_line(record, keep_data))
+        if len(header) > len(written):
+            out.write(_header_line(header, written))
+    return target
+
+def _header_line(header, written):
+    new = {key: value for key, value in header.items() if key not in written}
+    written.update(new)
+    return json.dumps({"header": new}, separators=(",", ":")) + "\n"
+
+def _compact_line(record, keep_data):
+    stats = dict(record.get("stats", {}))
+    data = stats.pop("data", None)
+    if keep_data and data:
+        stats["data_f32"] = pack_data(data)
+    return json.dumps(dict(record, stats=stats), separators=(",", ":")) + "\n"
+
+if __name__ == "__main__":
+    import os
+    import sys
+    args = [arg for arg in sys.argv[1:] if arg != "--drop-data"]
+    if not 1 <= len(args) <= 2:
+        print(f"Usage: python {sys.argv[0]} <benchmark_results.json> [<out{COMPACT_SUFFIX}>] [--drop-data]")
+        exit(1)
+    target = convert(args[0], args[1] if len(args) == 2 else None, "--drop-data" not in sys.argv)
+    print(f"{args[0]} ({os.path.getsize(args[0])} bytes) -> {target} ({os.path.getsize(target)} bytes)")
@@ -1,9 +1,9 @@
-import json
+import math
+from benchmark_results import iter_benchmarks
 
 def load_benchmarks(filename):
-    with open(filename, "r") as f:
-        data = json.load(f)
-    return data.get("benchmarks", [])
+    """Benchmark records of a --benchmark-json file or a compact .jsonl.gz, see benchmark_results.py"""
+    return list(iter_benchmarks(filename))
 
 def format_us(x):
     """Format number as microseconds with 2 decimals, or empty if missing."""
@@ -17,11 +17,39 @@ def format_number(x):
         return f"{x:.2e}"
     return str(x)
 
-def make_table(benchmarks):
+def format_kib(x):
+    """Format bytes as KiB with 1 decimal, or empty if missing."""
+    if isinstance(x, (float, int)):
+        return f"{x / 1024:.1f}"
+    return ""
+
+# Columns added when the run was made with --benchmark-memory
+MEMORY_COLUMNS = [
+    ("Peak alloc (KiB)", "peak_alloc_bytes"),
+    ("RSS delta (KiB)", "rss_delta_bytes"),
+]
+
+# Group whose lowest median is the fixed cost of any call into the library, see benchmarks/test_call_floor_bench.py
+CALL_FLOOR_GROUP = "call_floor"
+
+def call_floor(benchmarks):
+    """Lowest median of the call_floor group, None when the run has none"""
+    medians = [bm["stats"]["median"] for bm in benchmarks if bm.get("group") == CALL_FLOOR_GROUP]
+    return min(medians) if medians else None
+
+def make_table(benchmarks, floor=None):
+    """`floor` (seconds) adds a floor subtracted median column, see call_floor"""
     headers = [
         "Run Name", "Rounds", "Min (µs)", "Max (µs)", "Mean (µs)", "Median (µs)",
         "Stddev (µs)", "Ops/sec"
     ]
+    memory_columns = [
+        (header, key) for header, key in MEMORY_COLUMNS
+        if any(key in bm.get("extra_info", {}) for bm in benchmarks)
+    ]
+    headers += [header for header, _ in memory_columns]
+    if floor is not None:
+        headers.append("Median - floor (µs)")
     lines = ["| " + " | ".join(headers) + " |", "|" + "----|" * len(headers)]
     for bm in benchmarks:
         stats = bm["stats"]
@@ -36,14 +64,126 @@ def make_table(benchmarks):
             format_us(stats.get("stddev", "")),
             format_number(stats.get("ops", "")),
         ]
+        extra_info = bm.get("extra_info", {})
+        row += [format_kib(extra_info.get(key, "")) for _, key in memory_columns]
+        if floor is not None:
+            row.append(format_us(max(stats["median"] - floor, 0.0)))
         lines.append("| " + " | ".join(row) + " |")
     return "\n".join(lines)
 
+# Order of the data sizes in the summary, unknown sizes go last
+DATA_SIZE_ORDER = ["small", "medium", "large", "xlarge", "1m", "10m"]
+# Value the others are compared to in the cost breakdown, the fastest value for other parameters
+BREAKDOWN_BASELINES = {"ma_type": "simple", "dev_type": "standard"}
+
+def size_key(size):
+    return (DATA_SIZE_ORDER.index(size), "") if size in DATA_SIZE_ORDER else (len(DATA_SIZE_ORDER), str(size))
+
+def summarize(benchmarks):
+    """
+    One pass over the records, returns (extremes, medians):
+    extremes: (group, data_size) -> [fastest record, slowest record] by median
+    medians: (group, data_size) -> {params: median}, what cost_breakdown needs
+    Only the two extreme records per cell are kept, so it runs on a stream of any length.
+    """
+    extremes, medians = {}, {}
+    for bm in benchmarks:
+        params = bm.get("params") or {}
+        cell = (bm.get("group") or "", str(params.get("data_size", "")))
+        median = bm["stats"]["median"]
+        bm = dict(bm, stats={key: value for key, value in bm["stats"].items() if key != "data"})
+        if cell not in extremes:
+            extremes[cell] = [bm, bm]
+        elif median < extremes[cell][0]["stats"]["median"]:
+            extremes[cell][0] = bm
+        elif median > extremes[cell][1]["stats"]["median"]:
+            extremes[cell][1] = bm
+        medians.setdefault(cell, {})[tuple(sorted(params.items()))] = median
+    return extremes, medians
+
+def cost_breakdown(medians):
+    """
+    How much slower each parameter value is than the baseline value, as the geometric mean of
+    median ratios over every pair of runs differing only in that parameter (same group and size).
+    Returns {param: [(value, geometric mean ratio, min ratio, max ratio, pairs)]}, baseline first
+    then cheapest to most expensive.
+    """
+    # param -> (cell, other params) -> {value: median}
+    by_param = {}
+    for cell, cell_medians in medians.items():
+        for params, median in cell_medians.items():
+            for name, value in params:
+                if name == "data_size":
+                    continue
+                rest = tuple(item for item in params if item[0] != name)
+                by_param.setdefault(name, {}).setdefault((cell, rest), {})[value] = median
+    breakdown = {}
+    for name, runs in by_param.items():
+        values = sorted({value for run in runs.values() for value in run}, key=lambda v: (str(type(v)), v))
+        baseline = BREAKDOWN_BASELINES.get(name, values[0])
+        log_ratios = {value: [] for value in values if value != baseline}
+        for run in runs.values():
+            if run.get(baseline, 0) <= 0:
+                continue
+            for value, median in run.items():
+                if value != baseline and median > 0:
+                    log_ratios[value].append(math.log(median / run[baseline]))
+        rows = [
+            (value, math.exp(sum(logs) / len(logs)), math.exp(min(logs)), math.exp(max(logs)), len(logs))
+            for value, logs in log_ratios.items() if logs
+        ]
+        if rows:
+            breakdown[name] = [(baseline, 1.0, 1.0, 1.0, 0)] + sorted(rows, key=lambda row: row[1])
+    return breakdown
+
+def make_summary(benchmarks, sizes=None, floor=None):
+    """Markdown with the fastest and slowest combination per group and data size, then the cost breakdown"""
+    extremes, medians = summarize(benchmarks)
+    if floor is None:
+        floor = min(
+            (bm["stats"]["median"] for (group, _), pair in extremes.items() if group == CALL_FLOOR_GROUP for bm in pair),
+            default=None,
+        )
+    sections = []
+    for group, size in sorted(extremes, key=lambda cell: (cell[0], size_key(cell[1]))):
+        if sizes and size not in sizes:
+            continue
+        fastest, slowest = extremes[(group, size)]
+        rows = [fastest] if fastest is slowest else [fastest, slowest]
+        title = f"{group} [{size}]" if size else group
+        sections.append(f"##### {title}\n\n" + make_table(rows, floor))
+    breakdown = cost_breakdown(medians)
+    for name, rows in sorted(breakdown.items()):
+        lines = [
+            f"##### Cost of `{name}`, relative to `{rows[0][0]}`",
+            "",
+            "| Value | Geometric mean | Min | Max | Pairs |",
+            "|----|----|----|----|----|",
+        ]
+        for value, mean, low, high, pairs in rows:
+            lines.append(f"| `{value}` | {mean:.2f}x | {low:.2f}x | {high:.2f}x | {pairs} |")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
 if __name__ == "__main__":
+    import itertools
     import sys
-    if len(sys.argv) != 2:
-        print(f"Usage: python {sys.argv[0]} <benchmark_results.json>")
+    args = sys.argv[1:]
+    floor = None
+    if "--floor" in args:
+        # Call floor from another run, e.g. when the results don't include the call_floor group
+        index = args.index("--floor")
+        floor = call_floor(load_benchmarks(args[index + 1]))
+        del args[index:index + 2]
+    if len(args) >= 2 and args[0] == "--summary":
+        # Streams every file, only the extremes and the medians are kept
+        records = itertools.chain.from_iterable(iter_benchmarks(filename) for filename in args[1:])
+        print(make_summary(records, floor=floor))
+        exit(0)
+    if len(args) != 1:
+        print(f"Usage: python {sys.argv[0]} <benchmark_results.json|.jsonl.gz> [--floor <results with call_floor>]")
+        print(f"       python {sys.argv[0]} --summary <benchmark_results.json|.jsonl.gz>... [--floor <results>]")
         exit(1)
-    benchmarks = load_benchmarks(sys.argv[1])
-    table = make_table(benchmarks)
+    benchmarks = load_benchmarks(args[0])
+    table = make_table(benchmarks, floor if floor is not None else call_floor(benchmarks))
     print(table)
@@ -0,0 +1,127 @@
+"""
+Adaptive round scheduling (--benchmark-adaptive).
+
+pytest-benchmark runs every benchmark for --benchmark-max-time, whatever its noise: a fast quiet
+cell collects 100k rounds it doesn't need, a slow noisy one stops at a few hundred. Here sampling
+stops once the distribution free 95% confidence interval of the median is within the target
+precision and the coefficient of variation (stddev / mean) is at most MAX_CV. A narrow median CI
+alone says little about a bimodal or heavy tailed cell, with enough rounds it converges at any
+spread, the CV bound keeps those sampling and marks them unconverged. The time a cell doesn't use goes into a shared pool that cells which haven't converged
+at their allowance can draw from, up to NOISY_ALLOWANCE times --benchmark-max-time.
+"""
+import math
+import statistics
+import time
+
+PILOT_ROUNDS = 10
+TARGET_PRECISION = 0.01
+MAX_CV = 0.25
+NOISY_ALLOWANCE = 4.0
+Z_95 = 1.959964
+
+
+def median_ci(sorted_values, z=Z_95):
+    """(low, high) order statistic confidence interval of the median of sorted values"""
+    n = len(sorted_values)
+    half_width = z * math.sqrt(n) / 2
+    low = max(int(math.floor(n / 2 - half_width)), 0)
+    high = min(int(math.ceil(n / 2 + half_width)), n - 1)
+    return sorted_values[low], sorted_values[high]
+
+
+def relative_ci(values):
+    """Half width of the median confidence interval relative to the median"""
+    ordered = sorted(values)
+    median = ordered[len(ordered) // 2]
+    low, high = median_ci(ordered)
+    return (high - low) / 2 / median if median > 0 else math.inf
+
+
+def coefficient_of_variation(values):
+    """Sample stddev relative to the mean"""
+    mean = statistics.fmean(values)
+    return statistics.stdev(values) / mean if len(values) > 1 and mean > 0 else math.inf
+
+
+class AdaptiveBudget:
+    """Sampling time shared by the session, `total` caps it when given"""
+
+    def __init__(self, precision=TARGET_PRECISION, total=None, max_cv=MAX_CV):
+        self.precision = precision
+        self.total = total
+        self.max_cv = max_cv
+        self.pool = 0.0
+        self.spent = 0.0
+
+    def allowance(self, max_time):
+        """Seconds a cell may sample before asking for more"""
+        if self.total is not None:
+            return max(min(max_time, self.total - self.spent), 0.0)
+        return max_time
+
+    def extra(self, max_time, used):
+        """Seconds a cell that hasn't converged may take from the pool"""
+        extra = min(self.pool, max_time * NOISY_ALLOWANCE - used)
+        if self.total is not None:
+            extra = min(extra, self.total - self.spent - used)
+        return max(extra, 0.0)
+
+    def settle(self, allowance, used):
+        self.spent += used
+        self.pool = max(self.pool + allowance - used, 0.0)
+
+
+class AdaptiveSchedulerMixin:
+    """
+    Mixed into pytest-benchmark's fixture class: replaces the fixed round count of
+    benchmark(...) with the adaptive schedule, `_adaptive_budget` is set by the fixture.
+    Calibration and warmup are pytest-benchmark's own.
+    """
+
+    _adaptive_budget = None
+
+    def _raw(self, function_to_benchmark, *args, **kwargs):
+        # Profiling runs are not about timing precision, they keep the fixed schedule
+        if not self.enabled or self._adaptive_budget is None or self.cprofile:
+            return super()._raw(function_to_benchmark, *args, **kwargs)
+        budget = self._adaptive_budget
+        runner = self._make_runner(function_to_benchmark, args, kwargs)
+        duration, iterations, loops_range = self._calibrate_timer(runner)
+        stats = self._make_stats(iterations)
+        if self._warmup:
+            for _ in range(max(1, int(self._warmup / iterations))):
+                runner(loops_range)
+
+        allowance = budget.allowance(self._max_time)
+        limit = allowance
+        samples = []
+        start = time.perf_counter()
+        batch = max(PILOT_ROUNDS, self._min_rounds)
+        converged = False
+        while True:
+            for _ in range(batch):
+                sample = runner(loops_range)
+                samples.append(sample)
+                stats.update(sample)
+            used = time.perf_counter() - start
+            precision = relative_ci(samples)
+            cv = coefficient_of_variation(samples)
+            if len(samples) >= self._min_rounds and precision <= budget.precision and cv <= budget.max_cv:
+                converged = True
+                break
+            if used >= limit:
+                extra = budget.extra(self._max_time, used)
+                if extra <= 0:
+                    break
+                limit = used + extra
+            # Grow geometrically, the CI narrows with sqrt(rounds)
+            batch = max(batch, len(samples) // 4)
+            batch = max(1, min(batch, int((limit - used) / (used / len(samples))) + 1))
+        budget.settle(allowance, used)
+        self.extra_info.update({
+            "adaptive_rounds": len(samples),
+            "median_ci_rel": round(precision, 5),
+            "cv": round(cv, 5),
+            "adaptive_converged": converged,
+        })
+        return function_to_benchmark(*args, **kwargs)
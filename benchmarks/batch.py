@@ -0,0 +1,32 @@
+"""
+Batch of windows: one single.* value per row of a 2-D array (symbols x window).
+
+Two strategies, same results:
+- batch_single: the rows go through one .tolist() and single.* is called once per row, the
+  per call cost is paid once per symbol.
+- batch_bulk: the rows are concatenated and the bulk.* function is called once with
+  period = window, window i starts at i * width in the concatenated series. Only one output in
+  `width` is kept, the others straddle two symbols, so this only wins when bulk.* is much
+  cheaper per output than the per call cost of single.*.
+"""
+import numpy as np
+
+
+def windows_from(series, count, width):
+    """`count` non overlapping windows of `width` consecutive values, as a (count, width) array"""
+    if count * width > len(series):
+        raise ValueError(f"{count} windows of {width} need {count * width} values, got {len(series)}")
+    return np.asarray(series[:count * width], dtype=np.float64).reshape(count, width)
+
+
+def batch_single(func, windows, *args):
+    """func(row, *args) for every row, 1-D result (2-D for tuple results, one column per value)"""
+    return np.asarray([func(row, *args) for row in np.asarray(windows).tolist()], dtype=np.float64)
+
+
+def batch_bulk(bulk_func, windows, *args):
+    """bulk_func(concatenated rows, *args, width), keeping the outputs of the windows that match a row"""
+    windows = np.asarray(windows)
+    width = windows.shape[1]
+    result = np.asarray(bulk_func(windows.ravel().tolist(), *args, width), dtype=np.float64)
+    return result[::width]
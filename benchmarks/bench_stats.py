@@ -0,0 +1,77 @@
+"""Small statistics helpers for benchmarks that report more than pytest-benchmark's stats"""
+import time
+
+# Minimum time per sample, calls are looped until a sample lasts this long
+MIN_SAMPLE_TIME = 0.02
+SAMPLE_REPEAT = 3
+
+
+def percentile(sorted_values, q):
+    """q-th percentile (0-100) of an already sorted list, linear interpolation"""
+    if not sorted_values:
+        raise ValueError("percentile of an empty list")
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1.0 - weight) + sorted_values[upper] * weight
+
+
+def latency_info(benchmark, quantiles=(50, 99)):
+    """
+    Per-round latency percentiles of a finished benchmark in µs, e.g. {'p50_us': .., 'p99_us': ..}.
+
+    Meant for benchmark.pedantic(..., iterations=1) where a round is a single call.
+    """
+    if not benchmark.stats:
+        return {}
+    values = sorted(benchmark.stats.stats.data)
+    return {f"p{q}_us": round(percentile(values, q) * 1e6, 3) for q in quantiles}
+
+
+def time_call(func, *args):
+    """Best per-call time in seconds over SAMPLE_REPEAT samples"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_TIME:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(SAMPLE_REPEAT - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+# Bars pushed while timing the per-bar benchmarks, the rest of the data is history seen before
+MAX_TICKS = 500
+
+
+def split_ticks(values, max_ticks=MAX_TICKS):
+    """(history, ticks), the last ticks of the series are streamed (at most half of it)"""
+    ticks = min(max_ticks, len(values) // 2)
+    return values[:len(values) - ticks], values[len(values) - ticks:]
+
+
+def tick_setup(ticks):
+    """pedantic setup passing the next tick as the only argument, one round per tick"""
+    stream = iter(ticks)
+    return lambda: ((next(stream),), {})
+
+
+def growing_series_setup(history, ticks, *args):
+    """pedantic setup for re-calling a batch function: appends the next tick, passes (series, *args)"""
+    series = list(history)
+    stream = iter(ticks)
+
+    def next_tick():
+        series.append(next(stream))
+        return (series, *args), {}
+
+    return next_tick
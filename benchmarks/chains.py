@@ -0,0 +1,117 @@
+"""
+Chained indicators computed from raw closes, as production does.
+
+stochastic_chain and macd_chain call the bulk functions one after the other, each stage
+materialising its list. The fused_* versions compute the same chain (simple moving averages
+only) in a single pass over the closes in Python: monotonic deques for the rolling max/min and
+running sums for the moving averages, no intermediate lists. A flat window (highest == lowest)
+gets whatever bulk.stochastic_oscillator returns for one, asked once per period.
+"""
+from collections import deque
+from functools import lru_cache
+from pytechnicalindicators import momentum_indicators
+
+STOCHASTIC_PERIOD = 14
+SLOW_PERIOD = 3
+SLOWEST_PERIOD = 3
+MACD_SHORT_PERIOD = 12
+MACD_LONG_PERIOD = 26
+SIGNAL_PERIOD = 9
+
+
+def stochastic_chain(close, ma_type, period=STOCHASTIC_PERIOD, slow_period=SLOW_PERIOD, slowest_period=SLOWEST_PERIOD):
+    """bulk.stochastic_oscillator -> bulk.slow_stochastic -> bulk.slowest_stochastic"""
+    stochastic = momentum_indicators.bulk.stochastic_oscillator(close, period)
+    slow = momentum_indicators.bulk.slow_stochastic(stochastic, ma_type, slow_period)
+    return momentum_indicators.bulk.slowest_stochastic(slow, ma_type, slowest_period)
+
+
+def macd_chain(close, ma_type, short_period=MACD_SHORT_PERIOD, long_period=MACD_LONG_PERIOD, signal_period=SIGNAL_PERIOD):
+    """bulk.macd_line -> bulk.signal_line, returns (macd, signal)"""
+    macd = momentum_indicators.bulk.macd_line(close, short_period, ma_type, long_period, ma_type)
+    return macd, momentum_indicators.bulk.signal_line(macd, ma_type, signal_period)
+
+
+@lru_cache(maxsize=None)
+def flat_stochastic(period):
+    """The library's stochastic oscillator of a window where every close is the same"""
+    return momentum_indicators.bulk.stochastic_oscillator([1.0] * period, period)[0]
+
+
+class _RunningMean:
+    """Mean of the last `period` values pushed, None until `period` values were pushed"""
+
+    __slots__ = ("period", "values", "total", "nans")
+
+    def __init__(self, period):
+        self.period = period
+        self.values = deque()
+        self.total = 0.0
+        # NaNs in the window are kept out of the total, which would stay NaN after they left
+        self.nans = 0
+
+    def push(self, value):
+        self.values.append(value)
+        if value != value:
+            self.nans += 1
+        else:
+            self.total += value
+        if len(self.values) > self.period:
+            old = self.values.popleft()
+            if old != old:
+                self.nans -= 1
+            else:
+                self.total -= old
+        if len(self.values) == self.period:
+            return self.total / self.period if not self.nans else float("nan")
+        return None
+
+
+def fused_stochastic_chain(close, period=STOCHASTIC_PERIOD, slow_period=SLOW_PERIOD, slowest_period=SLOWEST_PERIOD):
+    """Slowest stochastic (simple moving averages) in one pass, same length as stochastic_chain"""
+    highs, lows = deque(), deque()
+    slow, slowest = _RunningMean(slow_period), _RunningMean(slowest_period)
+    flat = flat_stochastic(period)
+    result = []
+    for i, price in enumerate(close):
+        # Indices of decreasing (highs) / increasing (lows) closes, the front is the window extreme
+        while highs and close[highs[-1]] <= price:
+            highs.pop()
+        highs.append(i)
+        while lows and close[lows[-1]] >= price:
+            lows.pop()
+        lows.append(i)
+        start = i - period + 1
+        if highs[0] < start:
+            highs.popleft()
+        if lows[0] < start:
+            lows.popleft()
+        if start < 0:
+            continue
+        highest, lowest = close[highs[0]], close[lows[0]]
+        stochastic = (price - lowest) / (highest - lowest) * 100.0 if highest != lowest else flat
+        slow_value = slow.push(stochastic)
+        if slow_value is None:
+            continue
+        slowest_value = slowest.push(slow_value)
+        if slowest_value is not None:
+            result.append(slowest_value)
+    return result
+
+
+def fused_macd_chain(close, short_period=MACD_SHORT_PERIOD, long_period=MACD_LONG_PERIOD, signal_period=SIGNAL_PERIOD):
+    """MACD line and signal line (simple moving averages) in one pass, returns (macd, signal)"""
+    short, long = _RunningMean(short_period), _RunningMean(long_period)
+    signal_mean = _RunningMean(signal_period)
+    macd, signal = [], []
+    for price in close:
+        short_value = short.push(price)
+        long_value = long.push(price)
+        if long_value is None:
+            continue
+        value = short_value - long_value
+        macd.append(value)
+        signal_value = signal_mean.push(value)
+        if signal_value is not None:
+            signal.append(signal_value)
+    return macd, signal
@@ -0,0 +1,75 @@
+"""
+Cold start probes: import time and first call latency of the submodules, measured in fresh
+interpreters.
+
+Every probe is a `python -c` run that times its own import and first call with perf_counter and
+prints them as JSON, the benchmark itself times the whole subprocess (interpreter start included),
+which is what a worker importing the library on every invocation pays.
+"""
+import json
+import os
+import subprocess
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A representative single.* call per submodule, `m` is the submodule, inputs are built before timing
+FIRST_CALLS = {
+    "candle_indicators": "m.single.moving_constant_envelopes(prices, 'simple', 3.0)",
+    "chart_trends": "m.peaks(prices, 20, 1)",
+    "correlation_indicators": "m.single.correlate_asset_prices(prices, highs, 'simple', 'standard')",
+    "momentum_indicators": "m.single.relative_strength_index(prices, 'simple')",
+    "moving_average": "m.single.moving_average(prices, 'simple')",
+    "other_indicators": "m.single.true_range(prices[-1], highs[-1], lows[-1])",
+    "standard_indicators": "m.single.simple_moving_average(prices)",
+    "strength_indicators": "m.single.accumulation_distribution(highs[-1], lows[-1], prices[-1], 1000.0, 0.0)",
+    "trend_indicators": "m.single.aroon_up(highs)",
+    "volatility_indicators": "m.single.ulcer_index(prices)",
+}
+
+_PROBE = """
+import json, time
+prices = [100.0 + (i % 7) * 0.5 for i in range(50)]
+highs = [p + 1.0 for p in prices]
+lows = [p - 1.0 for p in prices]
+start = time.perf_counter()
+{import_statement}
+imported = time.perf_counter()
+{access_statement}
+accessed = time.perf_counter()
+{call_statement}
+called = time.perf_counter()
+print(json.dumps({{"import_s": imported - start, "access_s": accessed - imported, "first_call_s": called - accessed}}))
+"""
+
+
+def probe_code(submodule=None, lazy=False, call=True):
+    """Source of a probe, no submodule is a bare interpreter start"""
+    if submodule is None:
+        return _PROBE.format(import_statement="pass", access_statement="pass", call_statement="pass")
+    if lazy:
+        import_statement = "import lazy_indicators"
+        access_statement = f"m = lazy_indicators.{submodule}" if call else "pass"
+    else:
+        import_statement = f"from pytechnicalindicators import {submodule} as m"
+        access_statement = "pass"
+    return _PROBE.format(
+        import_statement=import_statement,
+        access_statement=access_statement,
+        call_statement=FIRST_CALLS[submodule] if call else "pass",
+    )
+
+
+def run_probe(code):
+    """Run a probe in a fresh interpreter, returns its timings"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [BENCHMARKS_DIR, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median_ms(probes, key):
+    values = sorted(probe[key] for probe in probes)
+    return round(values[len(values) // 2] * 1e3, 3)
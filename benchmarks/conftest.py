@@ -0,0 +1,200 @@
+"""Shared pytest options, hooks and fixtures for the benchmark suite"""
+import os
+import pytest
+from adaptive import MAX_CV, TARGET_PRECISION, AdaptiveBudget, AdaptiveSchedulerMixin
+from derived_inputs import DerivedInputs
+from memory_profile import MemoryProfileMixin
+from result_cache import MAX_AGE_DAYS, MAX_ENTRIES, ResultCache, cache_key, record_variant, session_environment
+
+_fixture_classes = {}
+_cache_state = pytest.StashKey()
+_adaptive_budget = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("pytechnicalindicators benchmarks")
+    group.addoption(
+        "--scaling",
+        action="store_true",
+        default=False,
+        help="Run the scaling sweep benchmarks (fits time vs. length/period, slow)",
+    )
+    group.addoption(
+        "--benchmark-memory",
+        action="store_true",
+        default=False,
+        help="Also record peak Python allocations and RSS delta of every benchmark in extra_info",
+    )
+    group.addoption(
+        "--benchmark-adaptive",
+        action="store_true",
+        default=False,
+        help="Stop sampling once the median CI is within --benchmark-adaptive-precision, leftover time goes to noisy benchmarks",
+    )
+    group.addoption(
+        "--benchmark-adaptive-precision",
+        type=float,
+        default=TARGET_PRECISION,
+        help=f"Target half width of the 95%% median CI relative to the median (default: {TARGET_PRECISION})",
+    )
+    group.addoption(
+        "--benchmark-adaptive-max-cv",
+        type=float,
+        default=MAX_CV,
+        help=f"Largest stddev / mean a benchmark may have to count as converged (default: {MAX_CV})",
+    )
+    group.addoption(
+        "--benchmark-adaptive-budget",
+        type=float,
+        default=None,
+        help="Total sampling seconds for the session with --benchmark-adaptive (default: no cap)",
+    )
+    group.addoption(
+        "--persist-derived-inputs",
+        action="store_true",
+        default=False,
+        help="Keep the derived inputs of the chained benchmarks in .benchmark_cache/derived between runs",
+    )
+    group.addoption(
+        "--reuse-cache",
+        action="store_true",
+        default=False,
+        help="Skip benchmarks with a valid cached result and merge the cached stats into the JSON output",
+    )
+    group.addoption(
+        "--benchmark-cache-dir",
+        default=None,
+        help="Result cache directory (default: .benchmark_cache in the rootdir)",
+    )
+    group.addoption(
+        "--benchmark-cache-max-age",
+        type=float,
+        default=MAX_AGE_DAYS,
+        help=f"Days after which a cached result is stale (default: {MAX_AGE_DAYS})",
+    )
+    group.addoption(
+        "--benchmark-cache-max-entries",
+        type=int,
+        default=MAX_ENTRIES,
+        help=f"Oldest cached results above this count are evicted (default: {MAX_ENTRIES})",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "scaling: scaling sweep benchmark, only runs with --scaling"
+    )
+    if config.getoption("--benchmark-adaptive"):
+        config.stash[_adaptive_budget] = AdaptiveBudget(
+            config.getoption("--benchmark-adaptive-precision"),
+            config.getoption("--benchmark-adaptive-budget"),
+            config.getoption("--benchmark-adaptive-max-cv"),
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--scaling"):
+        skip_scaling = pytest.mark.skip(reason="scaling sweep, run with --scaling")
+        for item in items:
+            if "scaling" in item.keywords:
+                item.add_marker(skip_scaling)
+    if config.getoption("--reuse-cache"):
+        use_result_cache(config, items)
+
+
+def use_result_cache(config, items):
+    """Skip the benchmarks with a valid cached result, their records are merged in pytest_benchmark_update_json"""
+    cache = ResultCache(
+        config.getoption("--benchmark-cache-dir") or os.path.join(str(config.rootpath), ".benchmark_cache"),
+        config.getoption("--benchmark-cache-max-age"),
+        config.getoption("--benchmark-cache-max-entries"),
+    )
+    cache.evict()
+    machine_info = config._benchmarksession.get_machine_info()
+    environment = session_environment(machine_info, record_variant(config))
+    keys, cached = {}, []
+    skip_cached = pytest.mark.skip(reason="cached result, --reuse-cache")
+    for item in items:
+        if "benchmark" not in getattr(item, "fixturenames", ()) or item.get_closest_marker("skip"):
+            continue
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        key = cache_key(item.nodeid, params.get("data_size"), environment)
+        record = cache.get(key)
+        if record is None:
+            keys[item.nodeid] = key
+        else:
+            cached.append(record)
+            item.add_marker(skip_cached)
+    config.stash[_cache_state] = (cache, keys, cached)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    if _cache_state not in session.config.stash:
+        return
+    cache, keys, cached = session.config.stash[_cache_state]
+    benchmark_session = session.config._benchmarksession
+    for bench in benchmark_session.benchmarks:
+        if not bench.has_error and bench.fullname in keys:
+            cache.put(keys[bench.fullname], bench.as_dict(include_data=True))
+    # pytest-benchmark writes no JSON when nothing ran, i.e. when every cell came from the cache
+    if benchmark_session.json and cached and not benchmark_session.benchmarks:
+        config = session.config
+        commit_info = config.hook.pytest_benchmark_generate_commit_info(config=config)
+        output_json = config.hook.pytest_benchmark_generate_json(
+            config=config, benchmarks=[], include_data=True,
+            machine_info=benchmark_session.get_machine_info(), commit_info=commit_info,
+        )
+        config.hook.pytest_benchmark_update_json(config=config, benchmarks=[], output_json=output_json)
+        benchmark_session.save_json(output_json)
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    if _cache_state in config.stash:
+        _, _, cached = config.stash[_cache_state]
+        output_json["benchmarks"].extend(cached)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if _adaptive_budget in config.stash:
+        budget = config.stash[_adaptive_budget]
+        terminalreporter.write_line(
+            f"adaptive scheduler: {budget.spent:.1f}s sampling, {budget.pool:.1f}s of the max-time allowance unused"
+        )
+    if _cache_state in config.stash:
+        cache, _, cached = config.stash[_cache_state]
+        terminalreporter.write_line(
+            f"benchmark result cache: {len(cached)} reused, {cache.stored} stored ({cache.directory})"
+        )
+
+
+def fixture_class(base, mixins):
+    """Subclass of pytest-benchmark's fixture class with the suite mixins (pytest-benchmark requires the type)"""
+    key = (base, mixins)
+    if key not in _fixture_classes:
+        _fixture_classes[key] = type(base.__name__, mixins + (base,), {})
+    return _fixture_classes[key]
+
+
+@pytest.fixture(scope="session")
+def derived_inputs(request):
+    """Derived series (stochastic, slow stochastic, MACD lines) built once per session"""
+    directory = None
+    if request.config.getoption("--persist-derived-inputs"):
+        directory = os.path.join(str(request.config.rootpath), ".benchmark_cache", "derived")
+    return DerivedInputs(directory)
+
+
+@pytest.fixture
+def benchmark(benchmark, request):
+    """pytest-benchmark's fixture, extended according to the suite options"""
+    mixins = ()
+    if request.config.getoption("--benchmark-memory"):
+        mixins += (MemoryProfileMixin,)
+    if _adaptive_budget in request.config.stash:
+        mixins += (AdaptiveSchedulerMixin,)
+    if mixins:
+        benchmark.__class__ = fixture_class(type(benchmark), mixins)
+    if _adaptive_budget in request.config.stash:
+        benchmark._adaptive_budget = request.config.stash[_adaptive_budget]
+    return benchmark
@@ -2,6 +2,9 @@
 Data constants for PyTechnicalIndicators benchmarks.
 Converted from RustTI-benchmarks data_constants.rs
 """
+import math
+import os
+import random
 
 # 10Y of data - 2552 data points
 PRICES = [
@@ -1563,6 +1566,114 @@ SMALL_DATA_SIZE = int(len(PRICES) / 10)
 MEDIUM_DATA_SIZE = int(len(PRICES) / 2)
 # 10Y
 LARGE_DATA_SIZE = len(PRICES)
+# Synthetic extensions of the 10Y data (intraday-like lengths)
+XLARGE_DATA_SIZE = 100_000
+ONE_MILLION_DATA_SIZE = 1_000_000
+TEN_MILLION_DATA_SIZE = 10_000_000
+
+DATA_SIZE_POINTS = {
+    "small": SMALL_DATA_SIZE,
+    "medium": MEDIUM_DATA_SIZE,
+    "large": LARGE_DATA_SIZE,
+    "xlarge": XLARGE_DATA_SIZE,
+    "1m": ONE_MILLION_DATA_SIZE,
+    "10m": TEN_MILLION_DATA_SIZE,
+}
+
+# Sizes every test_*_bench.py runs by default, the synthetic tiers are opt-in:
+#   BENCHMARK_DATA_SIZES=small,medium,large,xlarge,1m pytest
+DEFAULT_DATA_SIZES = ["small", "medium", "large"]
+BENCHMARK_DATA_SIZES = [
+    size.strip()
+    for size in os.environ.get("BENCHMARK_DATA_SIZES", ",".join(DEFAULT_DATA_SIZES)).split(",")
+    if size.strip()
+]
+
+# Shared period axis for the bulk period sweeps, run on the large data
+BENCHMARK_PERIODS = [5, 20, 50, 200, 500]
+PERIOD_SWEEP_DATA_SIZE = "large"
+
+# Seed and block length used to bootstrap the synthetic tiers
+SYNTHETIC_SEED = 42
+SYNTHETIC_BLOCK_SIZE = 20
+# Pull back towards the last real close, keeps 10^7 bars from drifting off to inf/0
+SYNTHETIC_MEAN_REVERSION = 1e-3
+
+_synthetic_cache = {}
+
+def generate_ohlcv(length, seed=SYNTHETIC_SEED, block_size=SYNTHETIC_BLOCK_SIZE):
+    """
+    Extend the real OHLCV series to `length` bars by block-bootstrapping bars.
+
+    The first LARGE_DATA_SIZE bars are the real data. Each synthetic bar reuses
+    the close-to-close return, the open gap, the high/low wicks and the volume
+    of a real bar, sampled in blocks of `block_size` consecutive bars so
+    volatility clustering survives. Returns are demeaned and mildly mean
+    reverting so long series stay in the same price range.
+
+    The wicks are applied to max/min(open, close) so low <= open/close <= high
+    always holds. Same seed gives the same data, and a shorter series is
+    always a prefix of a longer one.
+    """
+    if length <= LARGE_DATA_SIZE:
+        return {
+            'close': CLOSE[:length],
+            'high': HIGH[:length],
+            'low': LOW[:length],
+            'open': OPEN[:length],
+            'volume': VOLUME[:length],
+        }
+
+    returns = [math.log(CLOSE[i] / CLOSE[i - 1]) for i in range(1, LARGE_DATA_SIZE)]
+    mean_return = sum(returns) / len(returns)
+    returns = [r - mean_return for r in returns]
+    gaps = [OPEN[i] / CLOSE[i - 1] for i in range(1, LARGE_DATA_SIZE)]
+    upper_wicks = [HIGH[i] / max(OPEN[i], CLOSE[i]) for i in range(1, LARGE_DATA_SIZE)]
+    lower_wicks = [LOW[i] / min(OPEN[i], CLOSE[i]) for i in range(1, LARGE_DATA_SIZE)]
+    volumes = VOLUME[1:]
+
+    close, high, low, open_, volume = list(CLOSE), list(HIGH), list(LOW), list(OPEN), list(VOLUME)
+    anchor = math.log(CLOSE[-1])
+    log_close = anchor
+    rng = random.Random(seed)
+    last_start = len(returns) - block_size
+    while len(close) < length:
+        start = rng.randint(0, last_start)
+        for i in range(start, min(start + block_size, start + length - len(close))):
+            prev_close = close[-1]
+            log_close += returns[i] - SYNTHETIC_MEAN_REVERSION * (log_close - anchor)
+            c = math.exp(log_close)
+            o = prev_close * gaps[i]
+            close.append(c)
+            open_.append(o)
+            high.append(max(o, c) * upper_wicks[i])
+            low.append(min(o, c) * lower_wicks[i])
+            volume.append(volumes[i])
+
+    return {'close': close, 'high': high, 'low': low, 'open': open_, 'volume': volume}
+
+def generate_symbols(count, length, seed=SYNTHETIC_SEED):
+    """
+    `count` independent synthetic symbols of `length` bars each.
+
+    Each symbol is the bootstrapped part of generate_ohlcv with its own seed,
+    the real bars are dropped so no two symbols share a prefix.
+    """
+    symbols = []
+    for i in range(count):
+        data = generate_ohlcv(LARGE_DATA_SIZE + length, seed=seed + i)
+        symbols.append({key: values[LARGE_DATA_SIZE:] for key, values in data.items()})
+    return symbols
+
+def _synthetic_data(length):
+    """Generated series of `length` bars, reusing the longest one generated so far"""
+    cached = _synthetic_cache.get(SYNTHETIC_SEED)
+    if cached is None or len(cached['close']) < length:
+        cached = generate_ohlcv(length)
+        _synthetic_cache[SYNTHETIC_SEED] = cached
+    if len(cached['close']) == length:
+        return dict(cached)
+    return {key: values[:length] for key, values in cached.items()}
 
 def get_test_data(size="large"):
     """Get test data of specified size"""
@@ -1570,6 +1681,10 @@ def get_test_data(size="large"):
         end_idx = SMALL_DATA_SIZE
     elif size == "medium":
         end_idx = MEDIUM_DATA_SIZE
+    elif size in DATA_SIZE_POINTS and DATA_SIZE_POINTS[size] > LARGE_DATA_SIZE:
+        data = _synthetic_data(DATA_SIZE_POINTS[size])
+        data['prices'] = data['close']
+        return data
     else:
         end_idx = LARGE_DATA_SIZE
     
@@ -0,0 +1,122 @@
+"""
+Derived inputs of the chained indicator benchmarks, computed once per session.
+
+slow_stochastic, slowest_stochastic and signal_line take series that are themselves indicator
+outputs (rolling stochastic values, rolling slow stochastic values, rolling MACD lines). Building
+them is a Python loop of single.* calls, far more expensive than the call being benchmarked, and
+was repeated in every (size, ma_type) cell. DerivedInputs builds each series once per
+(name, data size, windows, ma_type) and, with a directory, persists it as raw doubles that later
+sessions read back through mmap. The series are identical to the ones the tests built inline.
+"""
+import mmap
+import os
+from array import array
+from pytechnicalindicators import momentum_indicators
+from data_constants import get_test_data
+from result_cache import library_version
+
+FLOAT_SIZE = array("d").itemsize
+
+
+def stochastic_series(close, window=10):
+    """single.stochastic_oscillator over rolling windows of `window` closes"""
+    window = max(1, min(window, len(close)))
+    count = max(1, len(close) - window)
+    return [
+        momentum_indicators.single.stochastic_oscillator(close[i : i + window])
+        for i in range(count)
+    ]
+
+
+def slow_stochastic_series(stoch_values, window=20, ma_type="simple"):
+    """single.slow_stochastic over rolling windows of stochastic values"""
+    window = max(1, min(window, len(stoch_values)))
+    count = max(1, len(stoch_values) - window)
+    return [
+        momentum_indicators.single.slow_stochastic(stoch_values[i : i + window], ma_type)
+        for i in range(count)
+    ]
+
+
+def macd_series(close, window=50, short_period=12, ma_type="simple"):
+    """single.macd_line over rolling windows of `window` closes"""
+    window = max(2, min(window, len(close)))
+    count = max(1, len(close) - window)
+    return [
+        momentum_indicators.single.macd_line(close[i : i + window], short_period, ma_type, ma_type)
+        for i in range(count)
+    ]
+
+
+class DerivedInputs:
+    """Session cache of the derived series, optionally persisted to `directory`"""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._series = {}
+        self.built = 0
+        self.loaded = 0
+
+    def stochastic(self, data_size, window=10):
+        return self._get(
+            ("stochastic", data_size, window),
+            lambda: stochastic_series(get_test_data(data_size)["close"], window),
+        )
+
+    def slow_stochastic(self, data_size, window=10, slow_window=20, ma_type="simple"):
+        return self._get(
+            ("slow_stochastic", data_size, window, slow_window, ma_type),
+            lambda: slow_stochastic_series(self.stochastic(data_size, window), slow_window, ma_type),
+        )
+
+    def macd(self, data_size, window=50, short_period=12, ma_type="simple"):
+        return self._get(
+            ("macd", data_size, window, short_period, ma_type),
+            lambda: macd_series(get_test_data(data_size)["close"], window, short_period, ma_type),
+        )
+
+    def _get(self, key, build):
+        if key in self._series:
+            return self._series[key]
+        series = self._load(key)
+        if series is None:
+            series = build()
+            self.built += 1
+            self._save(key, series)
+        self._series[key] = series
+        return series
+
+    def _path(self, key):
+        # The series are library outputs, a new version gets new files
+        name = "-".join(str(part) for part in key + (library_version(),))
+        return os.path.join(self.directory, name + ".f64")
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                # Empty or truncated mid value, rebuilt like a missing file
+                if size == 0 or size % FLOAT_SIZE:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped).cast("d")
+                    try:
+                        series = view.tolist()
+                    finally:
+                        view.release()
+        except OSError:
+            return None
+        self.loaded += 1
+        return series
+
+    def _save(self, key, series):
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            array("d", series).tofile(f)
+        os.replace(temporary, path)
@@ -0,0 +1,161 @@
+"""
+Feature pipeline for the end-to-end benchmarks.
+
+A feature set is a dict of named steps, each step is (function, inputs, args):
+inputs are names of data columns ('close', 'high', ...) or of other steps, args are
+appended after them. Every step is computed at most once per symbol, so intermediate
+series (moving averages, true range) are shared by all the features using them.
+
+volatility_system is the exception: the native function takes only the raw high, low and
+close and computes its true range internally. The pipeline cannot pass it the
+shared true_range step, so that work is done twice per symbol, in both the pipeline and the
+naive feature sets.
+"""
+from pytechnicalindicators import (
+    candle_indicators,
+    momentum_indicators,
+    moving_average,
+    other_indicators,
+    standard_indicators,
+    volatility_indicators,
+)
+
+
+def previous(values):
+    """Series shifted by one bar (drops the last value)"""
+    return values[:-1]
+
+
+def following(values):
+    """Series without its first bar, aligned with `previous`"""
+    return values[1:]
+
+
+def ratio(numerators, denominators):
+    """Element-wise ratio, both series aligned on their last value"""
+    length = min(len(numerators), len(denominators))
+    return [
+        n / d for n, d in zip(numerators[-length:], denominators[-length:])
+    ]
+
+
+# Production feature set: RSI, MACD, Bollinger bands, ATR, OBV, Ichimoku and the
+# volatility system, plus the moving average, true range, price/MA and normalised ATR
+# features. The 20 bar SMA feeds two features, the true range feeds the ATR (as a
+# moving average of it) and the ATR feeds the normalised ATR.
+DEFAULT_FEATURE_SET = {
+    # Shared intermediate series
+    "previous_close": (previous, ("close",), ()),
+    "current_high": (following, ("high",), ()),
+    "current_low": (following, ("low",), ()),
+    "true_range": (
+        other_indicators.bulk.true_range,
+        ("previous_close", "current_high", "current_low"),
+        (),
+    ),
+    "sma_20": (moving_average.bulk.moving_average, ("close",), ("simple", 20)),
+    # Features
+    "rsi": (momentum_indicators.bulk.relative_strength_index, ("close",), ("smoothed", 14)),
+    "macd": (standard_indicators.bulk.macd, ("close",), ()),
+    "bollinger": (standard_indicators.bulk.bollinger_bands, ("close",), ()),
+    "price_to_sma": (ratio, ("close", "sma_20"), ()),
+    "atr": (moving_average.bulk.moving_average, ("true_range",), ("simple", 14)),
+    "natr": (ratio, ("atr", "close"), ()),
+    "obv": (momentum_indicators.bulk.on_balance_volume, ("close", "volume"), (0.0,)),
+    "ichimoku": (
+        candle_indicators.bulk.ichimoku_cloud,
+        ("high", "low", "close"),
+        (9, 26, 52),
+    ),
+    "volatility_system": (
+        volatility_indicators.bulk.volatility_system,
+        ("high", "low", "close"),
+        (14, 2.0, "simple"),
+    ),
+}
+
+DEFAULT_FEATURES = [
+    "rsi", "macd", "bollinger", "sma_20", "price_to_sma", "true_range", "atr", "natr",
+    "obv", "ichimoku", "volatility_system",
+]
+
+
+class FeaturePipeline:
+    """Computes the requested features of a feature set, sharing every intermediate step"""
+
+    def __init__(self, feature_set=None, features=None):
+        self.feature_set = DEFAULT_FEATURE_SET if feature_set is None else feature_set
+        self.features = list(DEFAULT_FEATURES if features is None else features)
+        self.order = self._resolve_order()
+
+    def _resolve_order(self):
+        """Steps in dependency order, each listed once"""
+        order = []
+        visiting = set()
+
+        def visit(name):
+            if name in order or name not in self.feature_set:
+                return
+            if name in visiting:
+                raise ValueError(f"Feature set has a cycle through {name}")
+            visiting.add(name)
+            for dependency in self.feature_set[name][1]:
+                visit(dependency)
+            visiting.discard(name)
+            order.append(name)
+
+        for feature in self.features:
+            if feature not in self.feature_set:
+                raise KeyError(f"Unknown feature {feature}")
+            visit(feature)
+        return order
+
+    def compute(self, data):
+        """Compute all features for one symbol, returns {feature: values}"""
+        values = dict(data)
+        for name in self.order:
+            func, inputs, args = self.feature_set[name]
+            values[name] = func(*(values[i] for i in inputs), *args)
+        return {feature: values[feature] for feature in self.features}
+
+    def shared_steps(self):
+        """Steps used more than once (as an input or as a returned feature), i.e. the work the pipeline saves"""
+        uses = {feature: 1 for feature in self.features}
+        for name in self.order:
+            for dependency in self.feature_set[name][1]:
+                if dependency in self.feature_set:
+                    uses[dependency] = uses.get(dependency, 0) + 1
+        return {name: count for name, count in uses.items() if count > 1}
+
+
+def average_true_range(close, high, low):
+    """
+    The "atr" feature in one go: 14 bar SMA of the true range against the previous close.
+    other_indicators.bulk.average_true_range takes close, high and low of the same bar, which
+    gives a different (one bar longer) series, so it can't stand in for the feature.
+    """
+    true_range = other_indicators.bulk.true_range(close[:-1], high[1:], low[1:])
+    return moving_average.bulk.moving_average(true_range, "simple", 14)
+
+
+def compute_independently(data):
+    """
+    Same features as DEFAULT_FEATURES with every indicator called on its own,
+    nothing shared. Baseline for the pipeline benchmarks.
+    """
+    close, high, low, volume = data['close'], data['high'], data['low'], data['volume']
+    return {
+        "rsi": momentum_indicators.bulk.relative_strength_index(close, "smoothed", 14),
+        "macd": standard_indicators.bulk.macd(close),
+        "bollinger": standard_indicators.bulk.bollinger_bands(close),
+        "sma_20": moving_average.bulk.moving_average(close, "simple", 20),
+        "price_to_sma": ratio(close, moving_average.bulk.moving_average(close, "simple", 20)),
+        "true_range": other_indicators.bulk.true_range(close[:-1], high[1:], low[1:]),
+        "atr": average_true_range(close, high, low),
+        "natr": ratio(average_true_range(close, high, low), close),
+        "obv": momentum_indicators.bulk.on_balance_volume(close, volume, 0.0),
+        "ichimoku": candle_indicators.bulk.ichimoku_cloud(high, low, close, 9, 26, 52),
+        "volatility_system": volatility_indicators.bulk.volatility_system(
+            high, low, close, 14, 2.0, "simple"
+        ),
+    }
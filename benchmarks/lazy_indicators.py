@@ -0,0 +1,37 @@
+"""
+Lazy facade over pytechnicalindicators (PEP 562 module __getattr__).
+
+`import lazy_indicators` doesn't import pytechnicalindicators, the first access to one of the
+submodules does, e.g. `lazy_indicators.momentum_indicators.single.relative_strength_index(...)`,
+and the submodule is then cached in the module namespace so later accesses are plain lookups.
+
+pytechnicalindicators is one native extension, its submodules can't be loaded one by one: the
+first access pays for loading all of it, what the facade saves is that cost on code paths (or
+worker invocations) which never touch an indicator.
+"""
+SUBMODULES = (
+    "candle_indicators",
+    "chart_trends",
+    "correlation_indicators",
+    "momentum_indicators",
+    "moving_average",
+    "other_indicators",
+    "standard_indicators",
+    "strength_indicators",
+    "trend_indicators",
+    "volatility_indicators",
+)
+
+
+def __getattr__(name):
+    if name not in SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # importlib itself is imported here too, it isn't loaded yet in a fresh interpreter
+    from importlib import import_module
+    module = getattr(import_module("pytechnicalindicators"), name)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
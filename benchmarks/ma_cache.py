@@ -0,0 +1,134 @@
+"""
+Memoized moving averages shared by the indicators of a symbol.
+
+MovingAverageCache.moving_average has the signature of moving_average.bulk.moving_average and
+returns the cached series for the same (series content, ma_type, period). Entries are evicted
+least recently used first once the cached lists exceed `max_bytes`. The series key is a hash of
+the values, or the `key` given by the caller (e.g. ("AAPL", "close", bar)) which skips the hashing.
+
+cached_feature_set() routes the moving average steps of a feature set (see feature_pipeline.py)
+through a cache, so several pipelines on the same symbol share their moving averages.
+"""
+import hashlib
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from pytechnicalindicators import moving_average, other_indicators
+from feature_pipeline import DEFAULT_FEATURE_SET, following, previous, ratio
+
+# Bytes of a float object, the lists hold references to them
+FLOAT_SIZE = sys.getsizeof(1.0)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def series_key(values):
+    """Content hash of a float series"""
+    return hashlib.blake2b(array('d', values).tobytes(), digest_size=16).digest()
+
+
+def footprint(values):
+    """Approximate bytes held by a list of floats"""
+    return sys.getsizeof(values) + len(values) * FLOAT_SIZE
+
+
+class MovingAverageCache:
+    """LRU cache of moving average series, bounded by their memory footprint"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, compute=moving_average.bulk.moving_average):
+        self.max_bytes = max_bytes
+        self.compute = compute
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def moving_average(self, values, ma_type, period, key=None):
+        entry_key = (series_key(values) if key is None else key, ma_type, period)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            self.saved_seconds += entry[2]
+            return entry[0]
+        self.misses += 1
+        start = time.perf_counter()
+        result = self.compute(values, ma_type, period)
+        elapsed = time.perf_counter() - start
+        size = footprint(result)
+        if size <= self.max_bytes:
+            self._entries[entry_key] = (result, size, elapsed)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return result
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / requests, 3) if requests else 0.0,
+            "saved_us": round(self.saved_seconds * 1e6, 1),
+            "cached_bytes": self.bytes,
+        }
+
+
+def envelope(average, percent):
+    """Constant envelope around a moving average: (lower, average, upper)"""
+    return [(a * (1 - percent / 100), a, a * (1 + percent / 100)) for a in average]
+
+
+def channel(average, width, multiplier):
+    """Channel of `multiplier` times `width` around an average, aligned on their last value"""
+    length = min(len(average), len(width))
+    return [
+        (a - multiplier * w, a, a + multiplier * w)
+        for a, w in zip(average[-length:], width[-length:])
+    ]
+
+
+# Second feature set on the same symbol: envelopes and a Keltner style channel built on the
+# 20 bar moving averages and the ATR. sma_20 and atr are also in DEFAULT_FEATURE_SET.
+CHANNEL_FEATURE_SET = {
+    "previous_close": (previous, ("close",), ()),
+    "current_high": (following, ("high",), ()),
+    "current_low": (following, ("low",), ()),
+    "true_range": (
+        other_indicators.bulk.true_range,
+        ("previous_close", "current_high", "current_low"),
+        (),
+    ),
+    "sma_20": (moving_average.bulk.moving_average, ("close",), ("simple", 20)),
+    "ema_20": (moving_average.bulk.moving_average, ("close",), ("exponential", 20)),
+    "atr": (moving_average.bulk.moving_average, ("true_range",), ("simple", 14)),
+    "envelope": (envelope, ("sma_20",), (3.0,)),
+    "keltner": (channel, ("ema_20", "atr"), (2.0,)),
+    "ema_to_sma": (ratio, ("ema_20", "sma_20"), ()),
+}
+
+CHANNEL_FEATURES = ["envelope", "keltner", "ema_to_sma", "atr"]
+
+
+def cached_feature_set(cache, feature_set=DEFAULT_FEATURE_SET):
+    """Copy of a feature set with its moving_average steps going through `cache`"""
+    return {
+        name: (cache.moving_average if func is moving_average.bulk.moving_average else func, inputs, args)
+        for name, (func, inputs, args) in feature_set.items()
+    }
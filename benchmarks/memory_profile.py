@@ -0,0 +1,63 @@
+"""
+Memory profiling for the benchmarks (--benchmark-memory).
+
+The benchmarked call is run twice more, outside of the timed rounds: once between two RSS
+readings and once under tracemalloc. tracemalloc sees the Python objects (the result lists and
+tuples), the RSS delta also catches allocations made on the native side. They are separate calls
+because tracemalloc's own bookkeeping would show up in the RSS.
+"""
+import gc
+import os
+import tracemalloc
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss():
+    """Resident set size of this process in bytes, None where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def measure_memory(func, *args, **kwargs):
+    """Call func twice, returns (result, {'peak_alloc_bytes', 'retained_alloc_bytes', 'rss_delta_bytes'})"""
+    gc.collect()
+    rss_before = current_rss()
+    result = func(*args, **kwargs)
+    rss_after = current_rss()
+    del result
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    info = {"peak_alloc_bytes": peak, "retained_alloc_bytes": retained}
+    if rss_before is not None and rss_after is not None:
+        info["rss_delta_bytes"] = rss_after - rss_before
+    return result, info
+
+
+class MemoryProfileMixin:
+    """
+    Mixed into pytest-benchmark's fixture class: the call is measured with
+    measure_memory and stored in extra_info, then timed as usual.
+    """
+
+    def __call__(self, function_to_benchmark, *args, **kwargs):
+        if self.enabled:
+            _, info = measure_memory(function_to_benchmark, *args, **kwargs)
+            self.extra_info.update(info)
+        return super().__call__(function_to_benchmark, *args, **kwargs)
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, **options):
+        # With a setup function every call gets fresh (often stateful) arguments,
+        # extra calls would shift them, so those are only timed.
+        if self.enabled and setup is None:
+            _, info = measure_memory(target, *args, **(kwargs or {}))
+            self.extra_info.update(info)
+        return super().pedantic(target, args=args, kwargs=kwargs, setup=setup, **options)
@@ -0,0 +1,38 @@
+"""
+NumPy in, NumPy out wrappers around the list based indicator functions.
+
+The functions take and return Python lists, so array based callers pay a
+.tolist() per input and a np.asarray on the result. These helpers make that
+round trip explicit so it can be timed apart from the indicator itself.
+"""
+import numpy as np
+from bench_stats import time_call
+
+
+def to_arrays(data, fields):
+    """Columns of the test data as float64 arrays"""
+    return [np.asarray(data[field], dtype=np.float64) for field in fields]
+
+
+def call_with_arrays(func, arrays, *args):
+    """Call func on array inputs, returns the result as an array (2-D for tuple results)"""
+    return np.asarray(func(*(array.tolist() for array in arrays), *args), dtype=np.float64)
+
+
+def convert_only(arrays, result):
+    """The conversions of call_with_arrays without the call, `result` stands for its output"""
+    inputs = [array.tolist() for array in arrays]
+    return inputs, np.asarray(result, dtype=np.float64)
+
+
+def conversion_breakdown(func, arrays, *args):
+    """Seconds spent converting vs. computing for one array round trip"""
+    lists = [array.tolist() for array in arrays]
+    result = func(*lists, *args)
+    compute = time_call(func, *lists, *args)
+    conversion = time_call(convert_only, arrays, result)
+    return {
+        "compute_us": round(compute * 1e6, 3),
+        "conversion_us": round(conversion * 1e6, 3),
+        "conversion_share": round(conversion / (conversion + compute), 3),
+    }
@@ -0,0 +1,124 @@
+"""
+Online least squares trend lines, updated one point at a time.
+
+chart_trends.overall_trend, peak_trend and valley_trend fit (slope, intercept) over the whole
+series on every call. OnlineLeastSquares keeps the running means and co-moments of the points
+(Welford style updates, which stay accurate at 10^6 points where raw sums of x^2 don't) and
+supports removing a point, so both growing and sliding windows cost O(1) per bar. Removals are
+not exact, their rounding errors add up over a long slide, so a sliding OnlineTrend re-fits its
+window from scratch after every `window` removals (still O(1) per bar amortized).
+
+The online trends assume the batch semantics: x is the bar index from 0, peak_trend/valley_trend
+fit the (index, value) points of chart_trends.peaks/valleys with `period` and a closest_neighbor
+of PEAK_TREND_NEIGHBOR.
+"""
+from collections import deque
+from peak_tracker import PeakTracker, ValleyTracker
+
+PEAK_TREND_NEIGHBOR = 1
+
+
+class OnlineLeastSquares:
+    """Least squares line y = slope * x + intercept of the points added and not removed"""
+
+    __slots__ = ("count", "mean_x", "mean_y", "co_xx", "co_xy")
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self.co_xx = self.co_xy = 0.0
+
+    def append(self, x, y):
+        self.count += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.count
+        self.mean_y += (y - self.mean_y) / self.count
+        self.co_xx += dx * (x - self.mean_x)
+        self.co_xy += dx * (y - self.mean_y)
+
+    def remove(self, x, y):
+        """Undo append(x, y) of a point still in the fit"""
+        if self.count <= 1:
+            self.__init__()
+            return
+        count = self.count - 1
+        mean_x = (self.count * self.mean_x - x) / count
+        mean_y = (self.count * self.mean_y - y) / count
+        dx = x - mean_x
+        self.co_xx -= dx * (x - self.mean_x)
+        self.co_xy -= dx * (y - self.mean_y)
+        self.count, self.mean_x, self.mean_y = count, mean_x, mean_y
+
+    def fit(self, origin=0.0):
+        """(slope, intercept), the intercept is the line's value at x = origin"""
+        slope = self.co_xy / self.co_xx if self.co_xx > 0 else 0.0
+        return slope, self.mean_y + slope * (origin - self.mean_x)
+
+
+class OnlineTrend:
+    """overall_trend of the bars pushed so far, or of the last `window` bars"""
+
+    __slots__ = ("window", "fit", "_values", "_count", "_removed")
+
+    def __init__(self, window=None):
+        self.window = window
+        self.fit = OnlineLeastSquares()
+        self._values = deque()
+        self._count = 0
+        self._removed = 0
+
+    def update(self, price):
+        """Push the next bar, returns (slope, intercept) like overall_trend of the current window"""
+        index = self._count
+        self._count += 1
+        self.fit.append(index, price)
+        if self.window is not None:
+            self._values.append(price)
+            if len(self._values) > self.window:
+                self.fit.remove(index - self.window, self._values.popleft())
+                self._removed += 1
+                if self._removed == self.window:
+                    self._refit(index)
+        # overall_trend indexes its input from 0, i.e. from the first bar of the window
+        return self.fit.fit(origin=index - self.fit.count + 1)
+
+    def _refit(self, index):
+        """Fit of the window from its values, drops the error the removals accumulated"""
+        fit = OnlineLeastSquares()
+        start = index - len(self._values) + 1
+        for offset, value in enumerate(self._values):
+            fit.append(start + offset, value)
+        self.fit = fit
+        self._removed = 0
+
+
+class OnlinePeakTrend:
+    """peak_trend of the bars pushed so far, from a PeakTracker feeding an OnlineLeastSquares"""
+
+    _tracker_class = PeakTracker
+
+    __slots__ = ("tracker", "fit")
+
+    def __init__(self, period, closest_neighbor=PEAK_TREND_NEIGHBOR):
+        self.tracker = self._tracker_class(period, closest_neighbor)
+        self.fit = OnlineLeastSquares()
+
+    def update(self, price):
+        points = self.tracker.points
+        count = len(points)
+        last = points[-1] if points else None
+        changed = self.tracker.update(price)
+        if changed is not None:
+            # Same length means the closest_neighbor rule replaced the last point
+            if len(points) == count:
+                self.fit.remove(last[1], last[0])
+            self.fit.append(changed[1], changed[0])
+        return self.fit.fit()
+
+
+class OnlineValleyTrend(OnlinePeakTrend):
+    """valley_trend of the bars pushed so far"""
+
+    _tracker_class = ValleyTracker
+
+    __slots__ = ()
@@ -0,0 +1,143 @@
+"""
+Helpers for the multi-symbol throughput benchmarks.
+
+Runs one bulk indicator over every symbol of a synthetic universe, serially, in a
+ThreadPoolExecutor or in a ProcessPoolExecutor. The pools are created (and the
+symbols shipped to the worker processes) before timing, so the benchmarks measure
+steady state throughput rather than pool start up. ProcessPool is the process pool
+on its own, for other benchmarks with data shared by every call (the trend grids).
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pytechnicalindicators import candle_indicators, momentum_indicators
+
+# Size of the synthetic universe, the production one is ~5000 symbols
+SYMBOL_COUNT = int(os.environ.get("BENCHMARK_SYMBOLS", 200))
+SYMBOL_LENGTH = 2552
+
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+WORKER_COUNTS = sorted({w for w in (1, 2, 4, 8, CPU_COUNT) if w <= CPU_COUNT})
+# Serial timings behind the speed up and efficiency figures
+SERIAL_ROUNDS = 5
+
+# Indicator calls per symbol, looked up by name so only the name crosses process boundaries
+TASKS = {
+    "keltner": lambda data: candle_indicators.bulk.keltner_channel(
+        data['high'], data['low'], data['close'], "simple", "simple", 2.0, 20
+    ),
+    "mfi": lambda data: momentum_indicators.bulk.money_flow_index(
+        data['close'], data['volume'], 20
+    ),
+}
+
+# Data shared by every call of the current worker process, set by the pool initializer
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _init_probe(_):
+    return os.getpid()
+
+
+def _call_with_data(func, item):
+    return func(_worker_data, item)
+
+
+def _run_task(symbols, job):
+    task, index = job
+    return len(TASKS[task](symbols[index]))
+
+
+class ProcessPool:
+    """Persistent process pool, `data` is sent once per worker and passed to every call"""
+
+    def __init__(self, data, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(data,)
+        )
+        # Start every worker now rather than inside the first timed round
+        list(self.executor.map(_init_probe, range(workers)))
+
+    def map(self, func, items):
+        """[func(data, item) for item in items] on the workers, func must be a module level function"""
+        items = list(items)
+        chunksize = max(1, len(items) // (self.workers * 4))
+        return list(self.executor.map(_call_with_data, [func] * len(items), items, chunksize=chunksize))
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def run_serial(task, symbols):
+    """Run `task` over every symbol in the calling thread"""
+    func = TASKS[task]
+    return [len(func(data)) for data in symbols]
+
+
+class ThreadRunner:
+    """Runs `task` over every symbol on a persistent thread pool"""
+
+    def __init__(self, symbols, workers):
+        self.symbols = symbols
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def run(self, task):
+        func = TASKS[task]
+        return [len(result) for result in self.executor.map(func, self.symbols)]
+
+    def close(self):
+        self.executor.shutdown()
+
+
+class ProcessRunner:
+    """Runs `task` over every symbol on a persistent process pool, symbols are sent once per worker"""
+
+    def __init__(self, symbols, workers):
+        self.count = len(symbols)
+        self.pool = ProcessPool(symbols, workers)
+
+    def run(self, task):
+        return self.pool.map(_run_task, [(task, index) for index in range(self.count)])
+
+    def close(self):
+        self.pool.close()
+
+
+def throughput_info(count, seconds, workers, serial_seconds, unit="symbols"):
+    """`unit`/sec and parallel efficiency (1.0 = perfect linear speed up over serial)"""
+    return {
+        unit: count,
+        "workers": workers,
+        f"{unit}_per_sec": round(count / seconds, 2),
+        "speedup": round(serial_seconds / seconds, 3),
+        "parallel_efficiency": round(serial_seconds / (seconds * workers), 3),
+    }
+
+
+_serial_seconds = {}
+
+
+def serial_seconds(key, func, *args, rounds=SERIAL_ROUNDS):
+    """Best time of func(*args) over `rounds` calls, cached under `key`, the reference for the speed up"""
+    if key not in _serial_seconds:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+        _serial_seconds[key] = min(timings)
+    return _serial_seconds[key]
+
+
+def record_throughput(benchmark, count, workers, serial, unit="symbols"):
+    """Store throughput_info of the benchmark's best round in extra_info"""
+    if benchmark.stats:
+        benchmark.extra_info.update(
+            throughput_info(count, benchmark.stats.stats.min, workers, serial, unit)
+        )
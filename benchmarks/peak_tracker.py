@@ -0,0 +1,84 @@
+"""
+Incremental peak/valley detection, one bar at a time.
+
+chart_trends.peaks(prices, period, closest_neighbor) slides a `period` window over the series,
+takes the window maximum (the last occurrence on ties) as a candidate peak and keeps it unless
+it is within `closest_neighbor` bars of the previous peak, in which case the higher of the two
+is kept. PeakTracker produces the same list from a monotonic deque of the current window, so a
+new bar costs O(1) amortized instead of a rescan of the history. ValleyTracker is the mirror
+image for chart_trends.valleys (window minimum, the lower valley wins).
+
+These semantics are read from the library's description, not its code. test_tracker_full_series
+asserts the tracker output equals chart_trends.peaks/valleys of the installed library on every
+size and closest_neighbor, which is where a difference would show.
+"""
+from collections import deque
+
+
+class PeakTracker:
+    """Peaks of the bars pushed so far, as (value, index) like chart_trends.peaks"""
+
+    # Valleys are peaks of the negated prices
+    _sign = 1.0
+
+    __slots__ = ("period", "closest_neighbor", "points", "_window", "_count")
+
+    def __init__(self, period, closest_neighbor):
+        if period < 1:
+            raise ValueError("period must be at least 1")
+        self.period = period
+        self.closest_neighbor = closest_neighbor
+        self.points = []
+        # (index, signed value) with strictly decreasing values, the front is the window extreme
+        self._window = deque()
+        self._count = 0
+
+    @property
+    def peaks(self):
+        return self.points
+
+    def extend(self, prices):
+        for price in prices:
+            self.update(price)
+        return self.points
+
+    def update(self, price):
+        """Push the next bar, returns the (value, index) added or replaced, None if the list didn't change"""
+        index = self._count
+        self._count += 1
+        signed = price * self._sign
+        window = self._window
+        # Equal values are dropped too, ties go to the last occurrence
+        while window and window[-1][1] <= signed:
+            window.pop()
+        window.append((index, signed))
+        if window[0][0] <= index - self.period:
+            window.popleft()
+        if index < self.period - 1:
+            return None
+        extreme_index, extreme = window[0]
+        return self._record(extreme * self._sign, extreme_index, extreme)
+
+    def _record(self, value, index, signed):
+        points = self.points
+        if points:
+            last_value, last_index = points[-1]
+            if index - last_index <= self.closest_neighbor:
+                if signed > last_value * self._sign:
+                    points[-1] = (value, index)
+                    return points[-1]
+                return None
+        points.append((value, index))
+        return points[-1]
+
+
+class ValleyTracker(PeakTracker):
+    """Valleys of the bars pushed so far, as (value, index) like chart_trends.valleys"""
+
+    _sign = -1.0
+
+    __slots__ = ()
+
+    @property
+    def valleys(self):
+        return self.points
@@ -0,0 +1,155 @@
+"""
+Benchmark result cache (--reuse-cache).
+
+A finished benchmark is stored as its pytest-benchmark JSON record under a key made of the test
+nodeid, the pytechnicalindicators version, the Python version, a CPU fingerprint from machine_info,
+the data size and the options that change how the record was measured (RECORD_OPTIONS). While the key
+matches and the entry is younger than the maximum age the cell is skipped and the cached record
+is merged into the JSON output instead.
+"""
+import hashlib
+import json
+import os
+import platform
+import time
+from importlib import metadata
+
+CACHE_DIR = ".benchmark_cache"
+MAX_AGE_DAYS = 30
+MAX_ENTRIES = 20000
+
+# Options that change what a record holds or how its rounds were taken, a record is only reused
+# by a run with the same values. The adaptive settings only count with --benchmark-adaptive.
+RECORD_OPTIONS = (
+    "--benchmark-memory",
+    "--benchmark-adaptive",
+    "--benchmark-min-rounds",
+    "--benchmark-min-time",
+    "--benchmark-max-time",
+    "--benchmark-timer",
+    "--benchmark-calibration-precision",
+    "--benchmark-warmup",
+    "--benchmark-warmup-iterations",
+    "--benchmark-disable-gc",
+    "--benchmark-cprofile",
+)
+ADAPTIVE_OPTIONS = ("--benchmark-adaptive-precision", "--benchmark-adaptive-max-cv", "--benchmark-adaptive-budget")
+
+# machine_info fields identifying the CPU, the node name is left out so identical boards share a cache
+CPU_FIELDS = ("brand_raw", "arch", "count", "hz_advertised_friendly", "flags")
+
+
+def library_version():
+    try:
+        return metadata.version("pytechnicalindicators")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cpu_fingerprint(machine_info):
+    cpu = machine_info.get("cpu") or {}
+    fields = {field: cpu.get(field) for field in CPU_FIELDS}
+    fields["machine"] = machine_info.get("machine")
+    fields["system"] = machine_info.get("system")
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def cache_key(nodeid, data_size, environment):
+    """environment: library/python/cpu/variant fields shared by the whole session"""
+    fields = dict(environment, nodeid=nodeid, data_size=data_size)
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _option_value(value):
+    """Numbers given as strings on the command line compare by value ('1' and '1.0')"""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def record_variant(config):
+    """{option: value} of the RECORD_OPTIONS of a pytest config, part of the cache key"""
+    options = RECORD_OPTIONS
+    if config.getoption("--benchmark-adaptive"):
+        options += ADAPTIVE_OPTIONS
+    return {option: _option_value(config.getoption(option, None)) for option in options}
+
+
+def session_environment(machine_info, variant=""):
+    return {
+        "library": library_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cpu": cpu_fingerprint(machine_info),
+        "variant": variant,
+    }
+
+
+class ResultCache:
+    """One JSON file per entry in `directory`, evicted by age and, oldest first, by count"""
+
+    def __init__(self, directory=CACHE_DIR, max_age_days=MAX_AGE_DAYS, max_entries=MAX_ENTRIES):
+        self.directory = directory
+        self.max_age = max_age_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stored = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        """Cached record or None, expired or unreadable entries are removed"""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.max_age:
+            self._remove(path)
+            return None
+        self.hits += 1
+        return entry["benchmark"]
+
+    def put(self, key, record):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        # Written next to the target and renamed, a crashed run never leaves half an entry
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"created": time.time(), "benchmark": record}, f)
+        os.replace(temporary, path)
+        self.stored += 1
+
+    def evict(self):
+        """Remove expired entries, then the oldest ones above max_entries, returns how many were removed"""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".json")]
+        except OSError:
+            return 0
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort()
+        now = time.time()
+        expired = [path for mtime, path in entries if now - mtime > self.max_age]
+        kept = [path for mtime, path in entries if now - mtime <= self.max_age]
+        excess = kept[:max(len(kept) - self.max_entries, 0)]
+        for path in expired + excess:
+            self._remove(path)
+        return len(expired) + len(excess)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,74 @@
+"""
+Fixed capacity rolling window backed by a flat array('d').
+
+Every value is written twice, at i and i + capacity, so the last `capacity` values are
+always contiguous in the buffer. view() hands them out as a memoryview slice, no list is
+built per step. memoryview is a registered collections.abc.Sequence of floats, which is
+what the single.* functions extract their price lists from.
+"""
+from array import array
+from itertools import islice
+
+
+class RollingWindow:
+    """Last `capacity` floats pushed, oldest first"""
+
+    __slots__ = ("capacity", "_buffer", "_view", "_next", "_size")
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._buffer = array('d', bytes(16 * capacity))
+        self._view = memoryview(self._buffer)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def full(self):
+        return self._size == self.capacity
+
+    def append(self, value):
+        buffer = self._buffer
+        position = self._next
+        buffer[position] = value
+        buffer[position + self.capacity] = value
+        self._next = position + 1 if position + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def view(self):
+        """Zero copy memoryview of the window, only valid until the next append"""
+        end = self._next + self.capacity
+        return self._view[end - self._size:end]
+
+    def to_list(self):
+        """Copy of the window as a list"""
+        return self.view().tolist()
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __repr__(self):
+        return f"RollingWindow({self.capacity}, {self.to_list()})"
+
+
+def sliding_windows(values, width):
+    """Yield every window of `width` values as zero copy views, the RollingWindow counterpart of values[i:i + width]"""
+    window = RollingWindow(width)
+    # islice rather than slicing, which would copy `values`
+    values = iter(values)
+    window.extend(islice(values, width - 1))
+    for value in values:
+        window.append(value)
+        yield window.view()
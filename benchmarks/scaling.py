@@ -0,0 +1,74 @@
+"""
+Helpers for the scaling sweep benchmarks.
+
+Times a function over a geometric ladder of input lengths (or periods) and fits
+the empirical exponent k of time ~ c * x^k with a least squares fit in log-log space.
+"""
+import math
+from bench_stats import time_call
+
+
+def geometric_ladder(start, stop, factor=2):
+    """Geometric sequence start, start*factor, ... up to stop (inclusive)"""
+    if start < 1 or factor <= 1:
+        raise ValueError("start must be >= 1 and factor > 1")
+    ladder = []
+    value = start
+    while value <= stop:
+        ladder.append(int(value))
+        value *= factor
+    return ladder
+
+
+# Geometric ladders used by the sweeps
+LENGTH_LADDER = geometric_ladder(256, 65536, factor=4)
+PERIOD_LADDER = geometric_ladder(5, 160)
+# Length the period sweep runs on
+PERIOD_SWEEP_LENGTH = 16384
+
+# Exponents above this are reported as superlinear (leaves room for timer noise around 1.0)
+SUPERLINEAR_THRESHOLD = 1.15
+
+
+class ScalingWarning(UserWarning):
+    """Raised when a benchmarked function scales worse than linearly"""
+
+
+def fit_exponent(xs, times):
+    """
+    Fit log(time) = log(c) + k * log(x).
+
+    Returns (k, c, r_squared).
+    """
+    if len(xs) != len(times) or len(xs) < 2:
+        raise ValueError("Need at least two (x, time) points of equal length")
+    log_x = [math.log(x) for x in xs]
+    log_t = [math.log(t) for t in times]
+    n = len(log_x)
+    mean_x = sum(log_x) / n
+    mean_t = sum(log_t) / n
+    sxx = sum((x - mean_x) ** 2 for x in log_x)
+    sxt = sum((x - mean_x) * (t - mean_t) for x, t in zip(log_x, log_t))
+    k = sxt / sxx
+    intercept = mean_t - k * mean_x
+    ss_tot = sum((t - mean_t) ** 2 for t in log_t)
+    ss_res = sum((t - (intercept + k * x)) ** 2 for x, t in zip(log_x, log_t))
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return k, math.exp(intercept), r_squared
+
+
+def sweep(call_at, points):
+    """Time `call_at(point)` (a zero-argument callable factory) for every point of a ladder"""
+    return [time_call(call_at(point)) for point in points]
+
+
+def scaling_report(prefix, points, times):
+    """Fit the exponent and build the extra_info entries for one sweep"""
+    k, _, r_squared = fit_exponent(points, times)
+    return {
+        f"{prefix}_ladder": list(points),
+        f"{prefix}_times": times,
+        f"{prefix}_exponent": round(k, 3),
+        f"{prefix}_r2": round(r_squared, 3),
+        f"{prefix}_superlinear": k > SUPERLINEAR_THRESHOLD,
+    }
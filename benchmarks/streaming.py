@@ -0,0 +1,157 @@
+"""
+Streaming engine built on the single.* indicator functions.
+
+Bars are pushed one at a time, every registered indicator is updated and its latest
+value returned. Window based indicators keep their inputs in RollingWindow ring buffers
+and hand them to the single.* functions without copying, stateful ones (McGinley dynamic, A/D, OBV) only keep their previous value.
+"""
+from pytechnicalindicators import (
+    candle_indicators,
+    momentum_indicators,
+    moving_average,
+    strength_indicators,
+)
+from rolling_window import RollingWindow
+
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Previous McGinley dynamic both the engine and the bulk recompute start from
+MCGINLEY_SEED = 0.0
+
+
+class WindowIndicator:
+    """Calls `func(*windows, *args)` on the last `window` values of `fields` once enough bars were seen"""
+
+    def __init__(self, func, fields, window, *args):
+        self.func = func
+        self.fields = fields
+        self.window = window
+        self.args = args
+        self.buffers = [RollingWindow(window) for _ in fields]
+
+    def update(self, bar):
+        for field, buffer in zip(self.fields, self.buffers):
+            buffer.append(bar[field])
+        if not self.buffers[0].full:
+            return None
+        return self.func(*(buffer.view() for buffer in self.buffers), *self.args)
+
+
+class McGinleyDynamic:
+    """
+    moving_average.single.mcginley_dynamic from `previous` on, like bulk.mcginley_dynamic(prices, previous, period):
+    the first value is for the period-th bar, None before
+    """
+
+    def __init__(self, period, previous=0.0):
+        self.period = period
+        self.previous = previous
+        self.seen = 0
+
+    def update(self, bar):
+        if self.seen < self.period - 1:
+            self.seen += 1
+            return None
+        self.previous = moving_average.single.mcginley_dynamic(
+            bar['close'], self.previous, self.period
+        )
+        return self.previous
+
+
+class AccumulationDistribution:
+    """strength_indicators.single.accumulation_distribution, running total"""
+
+    def __init__(self, previous=0.0):
+        self.previous = previous
+
+    def update(self, bar):
+        self.previous = strength_indicators.single.accumulation_distribution(
+            bar['high'], bar['low'], bar['close'], bar['volume'], self.previous
+        )
+        return self.previous
+
+
+class OnBalanceVolume:
+    """momentum_indicators.single.on_balance_volume, running total"""
+
+    def __init__(self, previous=0.0):
+        self.previous = previous
+        self.previous_close = None
+
+    def update(self, bar):
+        if self.previous_close is not None:
+            self.previous = momentum_indicators.single.on_balance_volume(
+                bar['close'], self.previous_close, bar['volume'], self.previous
+            )
+        self.previous_close = bar['close']
+        return self.previous
+
+
+class StreamingEngine:
+    """Pushes bars through a registered set of indicators"""
+
+    def __init__(self):
+        self.indicators = {}
+
+    def register(self, name, indicator):
+        self.indicators[name] = indicator
+        return indicator
+
+    def push(self, bar):
+        """Update every indicator with a new bar, returns {name: latest value or None while warming up}"""
+        return {name: indicator.update(bar) for name, indicator in self.indicators.items()}
+
+
+def default_engine():
+    """Engine with the indicator set of the streaming benchmarks"""
+    engine = StreamingEngine()
+    engine.register(
+        "rsi", WindowIndicator(momentum_indicators.single.relative_strength_index, ("close",), 14, "smoothed")
+    )
+    engine.register(
+        "stochastic", WindowIndicator(momentum_indicators.single.stochastic_oscillator, ("close",), 14)
+    )
+    engine.register(
+        "keltner",
+        WindowIndicator(
+            candle_indicators.single.keltner_channel,
+            ("high", "low", "close"), 20, "simple", "simple", 2.0,
+        ),
+    )
+    engine.register("mcginley", McGinleyDynamic(20, MCGINLEY_SEED))
+    engine.register("ad", AccumulationDistribution())
+    engine.register("obv", OnBalanceVolume())
+    return engine
+
+
+class BulkRecompute:
+    """
+    Same indicators as default_engine, recomputed with the bulk.* functions over the
+    whole history on every bar. The alternative to streaming for live feeds.
+    """
+
+    def __init__(self, history):
+        self.history = {field: list(history[field]) for field in BAR_FIELDS}
+
+    def push(self, bar):
+        for field, values in self.history.items():
+            values.append(bar[field])
+        h = self.history
+        return {
+            "rsi": momentum_indicators.bulk.relative_strength_index(h['close'], "smoothed", 14)[-1],
+            "stochastic": momentum_indicators.bulk.stochastic_oscillator(h['close'], 14)[-1],
+            "keltner": candle_indicators.bulk.keltner_channel(
+                h['high'], h['low'], h['close'], "simple", "simple", 2.0, 20
+            )[-1],
+            "mcginley": moving_average.bulk.mcginley_dynamic(h['close'], MCGINLEY_SEED, 20)[-1],
+            "ad": strength_indicators.bulk.accumulation_distribution(
+                h['high'], h['low'], h['close'], h['volume'], 0.0
+            )[-1],
+            "obv": momentum_indicators.bulk.on_balance_volume(h['close'], h['volume'], 0.0)[-1],
+        }
+
+
+def bars(data, start=0):
+    """Dict per bar from column lists, starting at index `start`"""
+    for i in range(start, len(data['close'])):
+        yield {field: data[field][i] for field in BAR_FIELDS}
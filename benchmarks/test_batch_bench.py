@@ -0,0 +1,49 @@
+"""Benchmark tests for batches of windows (symbols x window): looped single.* calls vs. one bulk.* call on the concatenated rows"""
+from functools import lru_cache
+import numpy as np
+import pytest
+from pytechnicalindicators import candle_indicators, momentum_indicators
+from batch import batch_bulk, batch_single, windows_from
+from data_constants import generate_ohlcv
+
+BATCH_WIDTH = 20
+symbol_counts = [100, 1000]
+
+# name: (single function, bulk function, args before the period)
+BATCH_CALLS = {
+    "rsi": (
+        momentum_indicators.single.relative_strength_index,
+        momentum_indicators.bulk.relative_strength_index,
+        ("simple",),
+    ),
+    "mcb": (
+        candle_indicators.single.moving_constant_bands,
+        candle_indicators.bulk.moving_constant_bands,
+        ("simple", "standard", 3.0),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def batch_windows(symbols):
+    """Just enough bars for the batch, the synthetic tiers of get_test_data stay opt-in"""
+    return windows_from(generate_ohlcv(symbols * BATCH_WIDTH)['close'], symbols, BATCH_WIDTH)
+
+
+@pytest.mark.parametrize("indicator", list(BATCH_CALLS))
+@pytest.mark.parametrize("symbols", symbol_counts)
+class TestBatchWindows:
+    def test_batch_single(self, benchmark, symbols, indicator):
+        benchmark.group = f"batch_{indicator}"
+        single, bulk, args = BATCH_CALLS[indicator]
+        windows = batch_windows(symbols)
+        result = benchmark(batch_single, single, windows, *args)
+        assert result.shape[0] == symbols
+
+    def test_batch_bulk(self, benchmark, symbols, indicator):
+        benchmark.group = f"batch_{indicator}"
+        single, bulk, args = BATCH_CALLS[indicator]
+        windows = batch_windows(symbols)
+        result = benchmark(batch_bulk, bulk, windows, *args)
+        assert result.shape[0] == symbols
+        np.testing.assert_allclose(result, batch_single(single, windows, *args))
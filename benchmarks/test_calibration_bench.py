@@ -0,0 +1,20 @@
+"""Calibration benchmark, a fixed pure Python workload used to normalise for machine speed (see compare_benchmarks.py)"""
+import random
+import pytest
+
+# Fixed inputs, the workload must not change between runs or releases
+_rng = random.Random(1234)
+CALIBRATION_VALUES = [_rng.uniform(1000.0, 6000.0) for _ in range(2552)]
+
+def calibration_workload(values):
+    """Arithmetic, a sort and a rolling loop, roughly the kind of work the bindings do around the native code"""
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / len(values)
+    ordered = sorted(values)
+    rolling = [ordered[i] - ordered[i - 20] for i in range(20, len(ordered))]
+    return variance, rolling[-1]
+
+@pytest.mark.benchmark(group="calibration")
+def test_calibration(benchmark):
+    result = benchmark(calibration_workload, CALIBRATION_VALUES)
+    assert isinstance(result, tuple) and len(result) == 2
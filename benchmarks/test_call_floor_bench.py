@@ -0,0 +1,48 @@
+"""
+Per call overhead floor: the cheapest calls (scalar arguments, 1 and 2 element lists), where the
+time is Python -> native dispatch and argument conversion rather than compute.
+benchmark_to_markdown_table.py subtracts the lowest median of the call_floor group from every result.
+"""
+import pytest
+from pytechnicalindicators import moving_average, other_indicators, standard_indicators, strength_indicators
+
+# Scalar calls: three floats in, one float out
+SCALAR_CALLS = {
+    "volume_index": (strength_indicators.single.volume_index, (2.0, 1.5, 0.0)),
+    "true_range": (other_indicators.single.true_range, (1.5, 2.0, 1.0)),
+}
+
+# Tiny list calls: list extraction cost on top of the scalar floor
+LIST_CALLS = {
+    "simple_moving_average": (standard_indicators.single.simple_moving_average, ()),
+    "moving_average": (moving_average.single.moving_average, ("simple",)),
+}
+
+
+@pytest.mark.benchmark(group="call_floor")
+@pytest.mark.parametrize("call", sorted(SCALAR_CALLS))
+def test_call_floor_scalar(benchmark, call):
+    func, args = SCALAR_CALLS[call]
+    result = benchmark(func, *args)
+    assert isinstance(result, float)
+
+
+@pytest.mark.benchmark(group="call_floor")
+@pytest.mark.parametrize("length", [1, 2])
+@pytest.mark.parametrize("call", sorted(LIST_CALLS))
+def test_call_floor_list(benchmark, call, length):
+    func, args = LIST_CALLS[call]
+    prices = [100.0, 101.0][:length]
+    result = benchmark(func, prices, *args)
+    assert isinstance(result, float)
+
+
+def _python_noop(a, b, c):
+    return a
+
+
+@pytest.mark.benchmark(group="call_floor_python")
+def test_call_floor_python(benchmark):
+    """A pure Python function with the same arguments, what pytest-benchmark's loop costs by itself"""
+    result = benchmark(_python_noop, 2.0, 1.5, 0.0)
+    assert isinstance(result, float)
@@ -1,11 +1,11 @@
 """Benchmark tests for candle indicators (single and bulk, all variations, all dataset sizes)"""
 import pytest
 from pytechnicalindicators import candle_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES, BENCHMARK_PERIODS, PERIOD_SWEEP_DATA_SIZE
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
 dev_types = ["standard", "mean", "median", "mode", "ulcer"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 # Moving Constant Envelopes (single & bulk)
 @pytest.mark.parametrize("ma_type", ma_types)
@@ -191,3 +191,87 @@ class TestSupertrend:
         )
         assert isinstance(result, list)
 
+
+# Period sweeps (large data, shared period axis, one group per indicator)
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestMovingConstantEnvelopesPeriods:
+    @pytest.mark.benchmark(group="mce_bulk_period")
+    def test_bulk_mce_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.moving_constant_envelopes,
+            data['close'], ma_type, 3.0, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestMcGinleyDynamicEnvelopesPeriods:
+    @pytest.mark.benchmark(group="mcginley_env_bulk_period")
+    def test_bulk_mcginley_env_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.mcginley_dynamic_envelopes,
+            data['close'], 3.0, 0.0, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("dev_type", dev_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestMovingConstantBandsPeriods:
+    @pytest.mark.benchmark(group="bands_bulk_period")
+    def test_bulk_bands_period(self, benchmark, period, ma_type, dev_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.moving_constant_bands,
+            data['close'], ma_type, dev_type, 3.0, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("dev_type", dev_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestMcGinleyDynamicBandsPeriods:
+    @pytest.mark.benchmark(group="mcginley_bands_bulk_period")
+    def test_bulk_mcginley_bands_period(self, benchmark, period, dev_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.mcginley_dynamic_bands,
+            data['close'], dev_type, 3.0, 0.0, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestDonchianChannelsPeriods:
+    @pytest.mark.benchmark(group="donchian_bulk_period")
+    def test_bulk_donchian_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.donchian_channels,
+            data['high'], data['low'], period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestKeltnerChannelPeriods:
+    @pytest.mark.benchmark(group="keltner_bulk_period")
+    def test_bulk_keltner_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.keltner_channel,
+            data['high'], data['low'], data['close'], ma_type, ma_type, 2.0, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestSupertrendPeriods:
+    @pytest.mark.benchmark(group="supertrend_bulk_period")
+    def test_bulk_supertrend_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            candle_indicators.bulk.supertrend,
+            data['high'], data['low'], data['close'], ma_type, 2.0, period
+        )
+        assert isinstance(result, list)
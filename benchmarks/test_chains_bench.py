@@ -0,0 +1,41 @@
+"""Benchmark tests for chained indicators from raw closes (bulk chain per ma_type vs. fused single pass)"""
+import pytest
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from chains import fused_macd_chain, fused_stochastic_chain, macd_chain, stochastic_chain
+
+ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
+data_sizes = BENCHMARK_DATA_SIZES
+
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestStochasticChain:
+    @pytest.mark.benchmark(group="chain_stochastic")
+    @pytest.mark.parametrize("ma_type", ma_types)
+    def test_chain_stochastic_bulk(self, benchmark, data_size, ma_type):
+        data = get_test_data(data_size)
+        result = benchmark(stochastic_chain, data['close'], ma_type)
+        assert isinstance(result, list)
+
+    @pytest.mark.benchmark(group="chain_stochastic")
+    def test_chain_stochastic_fused(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        result = benchmark(fused_stochastic_chain, data['close'])
+        assert result == pytest.approx(stochastic_chain(data['close'], "simple"), rel=1e-9, abs=1e-9, nan_ok=True)
+
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestMACDChain:
+    @pytest.mark.benchmark(group="chain_macd")
+    @pytest.mark.parametrize("ma_type", ma_types)
+    def test_chain_macd_bulk(self, benchmark, data_size, ma_type):
+        data = get_test_data(data_size)
+        macd, signal = benchmark(macd_chain, data['close'], ma_type)
+        assert isinstance(macd, list) and isinstance(signal, list)
+
+    @pytest.mark.benchmark(group="chain_macd")
+    def test_chain_macd_fused(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        macd, signal = benchmark(fused_macd_chain, data['close'])
+        expected_macd, expected_signal = macd_chain(data['close'], "simple")
+        assert macd == pytest.approx(expected_macd, rel=1e-9, abs=1e-9)
+        assert signal == pytest.approx(expected_signal, rel=1e-9, abs=1e-9)
@@ -1,9 +1,9 @@
 """Benchmark tests for chart trends (all dataset sizes and all parameter variations)"""
 import pytest
 from pytechnicalindicators import chart_trends
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
 
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 class TestPeaks:
     @pytest.mark.benchmark(group="peaks")
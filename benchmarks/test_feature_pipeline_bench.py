@@ -0,0 +1,26 @@
+"""Benchmark tests for the feature pipeline (full per-symbol feature set, shared vs. independent calls)"""
+import pytest
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from feature_pipeline import DEFAULT_FEATURES, FeaturePipeline, compute_independently
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestFeaturePipeline:
+    @pytest.mark.benchmark(group="feature_pipeline")
+    def test_feature_pipeline_shared(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        pipeline = FeaturePipeline()
+        benchmark.extra_info["features"] = len(pipeline.features)
+        benchmark.extra_info["steps"] = len(pipeline.order)
+        benchmark.extra_info["shared_steps"] = pipeline.shared_steps()
+        result = benchmark(pipeline.compute, data)
+        assert list(result) == DEFAULT_FEATURES
+        # Both benchmarks must time the same features
+        assert result == compute_independently(data)
+
+    @pytest.mark.benchmark(group="feature_pipeline")
+    def test_feature_pipeline_independent(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        result = benchmark(compute_independently, data)
+        assert sorted(result) == sorted(DEFAULT_FEATURES)
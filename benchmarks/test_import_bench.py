@@ -0,0 +1,50 @@
+"""Cold start benchmarks: interpreter start + import + first call in fresh subprocesses, eager vs. lazy facade"""
+import pytest
+from cold_start import FIRST_CALLS, median_ms, probe_code, run_probe
+
+COLD_ROUNDS = 10
+submodules = sorted(FIRST_CALLS)
+
+
+def run_cold(benchmark, code):
+    """Times `rounds` fresh interpreters, the probes' own timings go into extra_info"""
+    probes = []
+
+    def probe():
+        result = run_probe(code)
+        probes.append(result)
+        return result
+
+    result = benchmark.pedantic(probe, rounds=COLD_ROUNDS, warmup_rounds=1, iterations=1)
+    benchmark.extra_info.update({
+        "import_ms": median_ms(probes, "import_s"),
+        "access_ms": median_ms(probes, "access_s"),
+        "first_call_ms": median_ms(probes, "first_call_s"),
+    })
+    return result
+
+
+@pytest.mark.benchmark(group="cold_import")
+def test_cold_interpreter(benchmark):
+    """Bare interpreter start, the floor of the other cold benchmarks"""
+    result = run_cold(benchmark, probe_code())
+    assert result["import_s"] >= 0
+
+
+@pytest.mark.benchmark(group="cold_import")
+@pytest.mark.parametrize("submodule", submodules)
+def test_cold_import(benchmark, submodule):
+    result = run_cold(benchmark, probe_code(submodule))
+    assert result["first_call_s"] >= 0
+
+
+@pytest.mark.benchmark(group="lazy_import")
+@pytest.mark.parametrize("mode", ["eager", "lazy_unused", "lazy_first_use"])
+def test_lazy_import(benchmark, mode):
+    """Eager import + call vs. the facade never touched vs. the facade used once"""
+    if mode == "eager":
+        code = probe_code("momentum_indicators")
+    else:
+        code = probe_code("momentum_indicators", lazy=True, call=mode == "lazy_first_use")
+    result = run_cold(benchmark, code)
+    assert result["import_s"] >= 0
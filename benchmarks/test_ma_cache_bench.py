@@ -0,0 +1,62 @@
+"""Benchmark tests for the shared moving average cache (two feature sets per symbol, with and without the cache)"""
+import pytest
+from data_constants import get_test_data
+from feature_pipeline import FeaturePipeline
+from ma_cache import CHANNEL_FEATURE_SET, CHANNEL_FEATURES, MovingAverageCache, cached_feature_set
+
+MA_CACHE_DATA_SIZE = "large"
+
+
+def run_pipelines(pipelines, data):
+    return [pipeline.compute(data) for pipeline in pipelines]
+
+
+def cache_stats_of_one_run(cache, pipelines, data, clear):
+    """Hit rate and time saved of a single run, outside of the timed rounds"""
+    if clear:
+        cache.clear()
+    cache.reset_stats()
+    run_pipelines(pipelines, data)
+    return cache.stats()
+
+
+@pytest.mark.benchmark(group="ma_cache")
+def test_ma_cache_off(benchmark):
+    """Both feature sets compute their own moving averages"""
+    data = get_test_data(MA_CACHE_DATA_SIZE)
+    pipelines = [FeaturePipeline(), FeaturePipeline(CHANNEL_FEATURE_SET, CHANNEL_FEATURES)]
+    result = benchmark(run_pipelines, pipelines, data)
+    assert len(result) == 2
+
+
+@pytest.mark.benchmark(group="ma_cache")
+def test_ma_cache_per_symbol(benchmark):
+    """One cache per symbol shared by both feature sets, emptied before every round (new symbol)"""
+    data = get_test_data(MA_CACHE_DATA_SIZE)
+    cache = MovingAverageCache()
+    pipelines = [
+        FeaturePipeline(cached_feature_set(cache)),
+        FeaturePipeline(cached_feature_set(cache, CHANNEL_FEATURE_SET), CHANNEL_FEATURES),
+    ]
+
+    def new_symbol():
+        cache.clear()
+        return (pipelines, data), {}
+
+    result = benchmark.pedantic(run_pipelines, setup=new_symbol, rounds=200, warmup_rounds=5)
+    benchmark.extra_info.update(cache_stats_of_one_run(cache, pipelines, data, clear=True))
+    assert len(result) == 2
+
+
+@pytest.mark.benchmark(group="ma_cache")
+def test_ma_cache_warm(benchmark):
+    """Same symbol recomputed with the cache kept (e.g. repeated requests for one bar), every MA hits"""
+    data = get_test_data(MA_CACHE_DATA_SIZE)
+    cache = MovingAverageCache()
+    pipelines = [
+        FeaturePipeline(cached_feature_set(cache)),
+        FeaturePipeline(cached_feature_set(cache, CHANNEL_FEATURE_SET), CHANNEL_FEATURES),
+    ]
+    result = benchmark(run_pipelines, pipelines, data)
+    benchmark.extra_info.update(cache_stats_of_one_run(cache, pipelines, data, clear=False))
+    assert len(result) == 2
@@ -1,11 +1,16 @@
 """Benchmark tests for momentum indicators (single and bulk, all dataset sizes and parameter variations)"""
 import pytest
 from pytechnicalindicators import momentum_indicators
-from data_constants import get_test_data
+from data_constants import (
+    get_test_data,
+    BENCHMARK_DATA_SIZES,
+    BENCHMARK_PERIODS,
+    PERIOD_SWEEP_DATA_SIZE,
+)
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
 dev_types = ["standard", "mean", "median", "ulcer", "mode"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 
 @pytest.mark.parametrize("ma_type", ma_types)
@@ -64,32 +69,16 @@ class TestSlowStochastic:
     """Slow Stochastic single and bulk benchmarks"""
 
     @pytest.mark.benchmark(group="slow_stoch_single")
-    def test_single_slow_stoch(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        window = max(1, min(10, len(data["close"])))
-        count = max(1, len(data["close"]) - window)
-        stoch_values = [
-            momentum_indicators.single.stochastic_oscillator(
-                data["close"][i : i + window]
-            )
-            for i in range(count)
-        ]
+    def test_single_slow_stoch(self, benchmark, data_size, ma_type, derived_inputs):
+        stoch_values = derived_inputs.stochastic(data_size, 10)
         result = benchmark(
             momentum_indicators.single.slow_stochastic, stoch_values, ma_type
         )
         assert isinstance(result, float)
 
     @pytest.mark.benchmark(group="slow_stoch_bulk")
-    def test_bulk_slow_stoch(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        window = max(1, min(10, len(data["close"])))
-        count = max(1, len(data["close"]) - window)
-        stoch_values = [
-            momentum_indicators.single.stochastic_oscillator(
-                data["close"][i : i + window]
-            )
-            for i in range(count)
-        ]
+    def test_bulk_slow_stoch(self, benchmark, data_size, ma_type, derived_inputs):
+        stoch_values = derived_inputs.stochastic(data_size, 10)
         period = max(1, min(20, len(stoch_values)))
         result = benchmark(
             momentum_indicators.bulk.slow_stochastic,
@@ -106,26 +95,9 @@ class TestSlowestStochastic:
     """Slowest Stochastic single and bulk benchmarks"""
 
     @pytest.mark.benchmark(group="slowest_stoch_single")
-    def test_single_slowest_stoch(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        # Build stochastic values
-        w1 = max(1, min(10, len(data["close"])))
-        c1 = max(1, len(data["close"]) - w1)
-        stoch_values = [
-            momentum_indicators.single.stochastic_oscillator(
-                data["close"][i : i + w1]
-            )
-            for i in range(c1)
-        ]
-        # Build slow stochastic series from rolling windows of stoch_values
-        w2 = max(1, min(20, len(stoch_values)))
-        c2 = max(1, len(stoch_values) - w2)
-        slow_stoch_values = [
-            momentum_indicators.single.slow_stochastic(
-                stoch_values[i : i + w2], "simple"
-            )
-            for i in range(c2)
-        ]
+    def test_single_slowest_stoch(self, benchmark, data_size, ma_type, derived_inputs):
+        # Slow stochastic series (simple) over rolling windows of the stochastic values
+        slow_stoch_values = derived_inputs.slow_stochastic(data_size, 10, 20, "simple")
         result = benchmark(
             momentum_indicators.single.slowest_stochastic,
             slow_stoch_values,
@@ -134,26 +106,8 @@ class TestSlowestStochastic:
         assert isinstance(result, float)
 
     @pytest.mark.benchmark(group="slowest_stoch_bulk")
-    def test_bulk_slowest_stoch(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        # Build stochastic values
-        w1 = max(1, min(10, len(data["close"])))
-        c1 = max(1, len(data["close"]) - w1)
-        stoch_values = [
-            momentum_indicators.single.stochastic_oscillator(
-                data["close"][i : i + w1]
-            )
-            for i in range(c1)
-        ]
-        # Build slow stochastic series from rolling windows of stoch_values
-        w2 = max(1, min(20, len(stoch_values)))
-        c2 = max(1, len(stoch_values) - w2)
-        slow_stoch_values = [
-            momentum_indicators.single.slow_stochastic(
-                stoch_values[i : i + w2], "simple"
-            )
-            for i in range(c2)
-        ]
+    def test_bulk_slowest_stoch(self, benchmark, data_size, ma_type, derived_inputs):
+        slow_stoch_values = derived_inputs.slow_stochastic(data_size, 10, 20, "simple")
         period = max(1, min(10, len(slow_stoch_values)))
         result = benchmark(
             momentum_indicators.bulk.slowest_stochastic,
@@ -381,32 +335,16 @@ class TestSignalLine:
     """Signal Line single and bulk benchmarks"""
 
     @pytest.mark.benchmark(group="signal_line_single")
-    def test_single_signal_line(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        window = max(2, min(50, len(data["close"])))
-        count = max(1, len(data["close"]) - window)
-        macd_values = [
-            momentum_indicators.single.macd_line(
-                data["close"][i : i + window], 12, "simple", "simple"
-            )
-            for i in range(count)
-        ]
+    def test_single_signal_line(self, benchmark, data_size, ma_type, derived_inputs):
+        macd_values = derived_inputs.macd(data_size, 50, 12, "simple")
         result = benchmark(
             momentum_indicators.single.signal_line, macd_values, ma_type
         )
         assert isinstance(result, float)
 
     @pytest.mark.benchmark(group="signal_line_bulk")
-    def test_bulk_signal_line(self, benchmark, data_size, ma_type):
-        data = get_test_data(data_size)
-        window = max(2, min(50, len(data["close"])))
-        count = max(1, len(data["close"]) - window)
-        macd_values = [
-            momentum_indicators.single.macd_line(
-                data["close"][i : i + window], 12, "simple", "simple"
-            )
-            for i in range(count)
-        ]
+    def test_bulk_signal_line(self, benchmark, data_size, ma_type, derived_inputs):
+        macd_values = derived_inputs.macd(data_size, 50, 12, "simple")
         period = max(1, min(20, len(macd_values)))
         result = benchmark(
             momentum_indicators.bulk.signal_line, macd_values, ma_type, period
@@ -537,3 +475,108 @@ class TestChandeMomentumOscillator:
             period,
         )
         assert isinstance(result, list)
+
+
+# Period sweeps: same large data, shared period axis, one group per indicator so
+# time vs. period can be compared across indicators and ma_types.
+
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestRelativeStrengthIndexPeriods:
+    """Bulk RSI over the shared period axis (all ma_types)"""
+
+    @pytest.mark.benchmark(group="rsi_bulk_period")
+    def test_bulk_rsi_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.relative_strength_index,
+            data["close"],
+            ma_type,
+            period,
+        )
+        assert isinstance(result, list)
+
+
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestOscillatorPeriods:
+    """Bulk stochastic, Williams %R, MFI and CMO over the shared period axis"""
+
+    @pytest.mark.benchmark(group="stoch_bulk_period")
+    def test_bulk_stoch_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.stochastic_oscillator, data["close"], period
+        )
+        assert isinstance(result, list)
+
+    @pytest.mark.benchmark(group="williams_bulk_period")
+    def test_bulk_williams_r_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.williams_percent_r,
+            data["high"],
+            data["low"],
+            data["close"],
+            period,
+        )
+        assert isinstance(result, list)
+
+    @pytest.mark.benchmark(group="mfi_bulk_period")
+    def test_bulk_mfi_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.money_flow_index,
+            data["close"],
+            data["volume"],
+            period,
+        )
+        assert isinstance(result, list)
+
+    @pytest.mark.benchmark(group="cmo_bulk_period")
+    def test_bulk_cmo_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.chande_momentum_oscillator,
+            data["close"],
+            period,
+        )
+        assert isinstance(result, list)
+
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestCommodityChannelIndexPeriods:
+    """Bulk CCI over the shared period axis (ma_types, standard deviation)"""
+
+    @pytest.mark.benchmark(group="cci_bulk_period")
+    def test_bulk_cci_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.commodity_channel_index,
+            data["close"],
+            ma_type,
+            "standard",
+            0.015,
+            period,
+        )
+        assert isinstance(result, list)
+
+
+@pytest.mark.parametrize("dev_type", dev_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestMcGinleyDynamicCCIPeriods:
+    """Bulk McGinley Dynamic CCI over the shared period axis (dev_types)"""
+
+    @pytest.mark.benchmark(group="mcginley_cci_bulk_period")
+    def test_bulk_mcginley_cci_period(self, benchmark, period, dev_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            momentum_indicators.bulk.mcginley_dynamic_commodity_channel_index,
+            data["close"],
+            0.0,
+            dev_type,
+            0.015,
+            period,
+        )
+        assert isinstance(result, list)
@@ -1,10 +1,10 @@
 """Benchmark tests for moving average indicators (single and bulk, all dataset sizes and MA types)"""
 import pytest
 from pytechnicalindicators import moving_average
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
 
 ma_types = ["simple", "smoothed", "exponential"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 @pytest.mark.parametrize("ma_type", ma_types)
 @pytest.mark.parametrize("data_size", data_sizes)
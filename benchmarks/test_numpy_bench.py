@@ -0,0 +1,46 @@
+"""Benchmark tests for NumPy array input/output (list compute vs. full array round trip vs. conversion only)"""
+import pytest
+from pytechnicalindicators import moving_average, standard_indicators
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from numpy_io import call_with_arrays, conversion_breakdown, convert_only, to_arrays
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+# name: (function, input columns, extra args)
+NUMPY_CALLS = {
+    "sma": (standard_indicators.bulk.simple_moving_average, ("close",), (20,)),
+    "smma": (standard_indicators.bulk.smoothed_moving_average, ("close",), (20,)),
+    "ema": (standard_indicators.bulk.exponential_moving_average, ("close",), (20,)),
+    "bollinger": (standard_indicators.bulk.bollinger_bands, ("close",), ()),
+    "macd": (standard_indicators.bulk.macd, ("close",), ()),
+    "rsi": (standard_indicators.bulk.rsi, ("close",), ()),
+    "ma_simple": (moving_average.bulk.moving_average, ("close",), ("simple", 20)),
+    "ma_smoothed": (moving_average.bulk.moving_average, ("close",), ("smoothed", 20)),
+    "ma_exponential": (moving_average.bulk.moving_average, ("close",), ("exponential", 20)),
+}
+
+@pytest.mark.parametrize("indicator", list(NUMPY_CALLS))
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestNumpyRoundTrip:
+    def test_numpy_lists(self, benchmark, data_size, indicator):
+        benchmark.group = f"numpy_{indicator}"
+        func, fields, args = NUMPY_CALLS[indicator]
+        data = get_test_data(data_size)
+        result = benchmark(func, *(data[field] for field in fields), *args)
+        assert isinstance(result, list)
+
+    def test_numpy_round_trip(self, benchmark, data_size, indicator):
+        benchmark.group = f"numpy_{indicator}"
+        func, fields, args = NUMPY_CALLS[indicator]
+        arrays = to_arrays(get_test_data(data_size), fields)
+        benchmark.extra_info.update(conversion_breakdown(func, arrays, *args))
+        result = benchmark(call_with_arrays, func, arrays, *args)
+        assert result.shape[0] == len(func(*(array.tolist() for array in arrays), *args))
+
+    def test_numpy_conversion(self, benchmark, data_size, indicator):
+        benchmark.group = f"numpy_{indicator}"
+        func, fields, args = NUMPY_CALLS[indicator]
+        arrays = to_arrays(get_test_data(data_size), fields)
+        output = func(*(array.tolist() for array in arrays), *args)
+        inputs, result = benchmark(convert_only, arrays, output)
+        assert len(inputs) == len(fields) and result.shape[0] == len(output)
@@ -0,0 +1,101 @@
+"""Benchmark tests for the online trend lines (per-bar update vs. re-calling chart_trends on the growing series)"""
+import pytest
+from pytechnicalindicators import chart_trends
+from bench_stats import growing_series_setup, latency_info, split_ticks, tick_setup
+from data_constants import generate_ohlcv, get_test_data, BENCHMARK_DATA_SIZES
+from online_trend import OnlinePeakTrend, OnlineTrend, OnlineValleyTrend
+
+# The per-bar comparison is about how the batch call grows with the history, add 1m with
+#   BENCHMARK_DATA_SIZES=small,medium,large,1m
+data_sizes = BENCHMARK_DATA_SIZES
+
+# Bars pushed while timing, fewer than the other tick benchmarks as the batch calls are O(n) at 1m
+TREND_TICKS = 200
+TREND_PERIOD = 50
+TREND_WINDOW = 200
+# Sliding window run of the default suite, long enough for removal errors to show (they did past 10^5 bars)
+LONG_SLIDE_LENGTH = 120_000
+LONG_SLIDE_ROUNDS = 3
+LONG_SLIDE_CHECK_EVERY = 500
+
+# name: (online trend factory taking the period, batch function taking (prices, period))
+TRENDS = {
+    "overall_trend": (lambda period: OnlineTrend(), lambda prices, period: chart_trends.overall_trend(prices)),
+    "peak_trend": (OnlinePeakTrend, chart_trends.peak_trend),
+    "valley_trend": (OnlineValleyTrend, chart_trends.valley_trend),
+}
+
+
+def run_trend(trend, prices):
+    result = None
+    for price in prices:
+        result = trend.update(price)
+    return result
+
+
+@pytest.mark.parametrize("kind", list(TRENDS))
+@pytest.mark.parametrize("data_size", data_sizes)
+def test_online_trend_full_series(benchmark, data_size, kind):
+    """Whole series through the online fit, same line as the batch call"""
+    benchmark.group = f"{kind}_online"
+    factory, batch = TRENDS[kind]
+    prices = get_test_data(data_size)['close']
+    result = benchmark(lambda: run_trend(factory(TREND_PERIOD), prices))
+    assert result == pytest.approx(batch(prices, TREND_PERIOD), rel=1e-9)
+
+
+@pytest.mark.parametrize("data_size", data_sizes)
+def test_online_trend_window(benchmark, data_size):
+    """Sliding window through the online fit, every step matches overall_trend of the window"""
+    benchmark.group = "overall_trend_online"
+    prices = get_test_data(data_size)['close']
+    result = benchmark(lambda: run_trend(OnlineTrend(TREND_WINDOW), prices))
+    trend = OnlineTrend(TREND_WINDOW)
+    for end, price in enumerate(prices, 1):
+        if end >= TREND_WINDOW:
+            assert trend.update(price) == pytest.approx(
+                chart_trends.overall_trend(prices[end - TREND_WINDOW:end]), rel=1e-9, abs=1e-9
+            )
+        else:
+            trend.update(price)
+    assert result == pytest.approx(chart_trends.overall_trend(prices[-TREND_WINDOW:]), rel=1e-9, abs=1e-9)
+
+
+def test_online_trend_window_long(benchmark):
+    """Sliding window over LONG_SLIDE_LENGTH bars, checked against overall_trend every LONG_SLIDE_CHECK_EVERY bars"""
+    benchmark.group = "overall_trend_online"
+    prices = generate_ohlcv(LONG_SLIDE_LENGTH)['close']
+    benchmark.pedantic(lambda: run_trend(OnlineTrend(TREND_WINDOW), prices), rounds=LONG_SLIDE_ROUNDS)
+    trend = OnlineTrend(TREND_WINDOW)
+    for end, price in enumerate(prices, 1):
+        result = trend.update(price)
+        if end >= TREND_WINDOW and end % LONG_SLIDE_CHECK_EVERY == 0:
+            assert result == pytest.approx(
+                chart_trends.overall_trend(prices[end - TREND_WINDOW:end]), rel=1e-9, abs=1e-9
+            )
+
+
+@pytest.mark.parametrize("kind", list(TRENDS))
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestOnlineTrendTick:
+    def test_online_tick(self, benchmark, data_size, kind):
+        benchmark.group = f"{kind}_tick"
+        factory, _ = TRENDS[kind]
+        prices = get_test_data(data_size)['close']
+        history, ticks = split_ticks(prices, TREND_TICKS)
+        trend = factory(TREND_PERIOD)
+        run_trend(trend, history)
+        benchmark.pedantic(trend.update, setup=tick_setup(ticks), rounds=len(ticks))
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert trend.fit.count > 0
+
+    def test_batch_recompute_tick(self, benchmark, data_size, kind):
+        """chart_trends re-called on the whole history for every new bar"""
+        benchmark.group = f"{kind}_tick"
+        _, batch = TRENDS[kind]
+        prices = get_test_data(data_size)['close']
+        history, ticks = split_ticks(prices, TREND_TICKS)
+        setup = growing_series_setup(history, ticks, TREND_PERIOD)
+        result = benchmark.pedantic(batch, setup=setup, rounds=len(ticks))
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert len(result) == 2
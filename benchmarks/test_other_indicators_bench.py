@@ -1,10 +1,10 @@
 """Benchmark tests for other_indicators (single and bulk, all dataset sizes and variations)"""
 import pytest
 from pytechnicalindicators import other_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES, BENCHMARK_PERIODS, PERIOD_SWEEP_DATA_SIZE
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 class TestReturnOnInvestment:
     @pytest.mark.benchmark(group="roi_single")
@@ -115,3 +115,28 @@ class TestPositivityIndicator:
             open_, prev_close, period, ma_type
         )
         assert isinstance(result, list)
+
+# Period sweeps (large data, shared period axis)
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestAverageTrueRangePeriods:
+    @pytest.mark.benchmark(group="atr_bulk_period")
+    def test_bulk_atr_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            other_indicators.bulk.average_true_range,
+            data['close'], data['high'], data['low'], ma_type, period
+        )
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestPositivityIndicatorPeriods:
+    @pytest.mark.benchmark(group="positivity_bulk_period")
+    def test_bulk_positivity_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            other_indicators.bulk.positivity_indicator,
+            data['open'], data['close'], period, ma_type
+        )
+        assert isinstance(result, list)
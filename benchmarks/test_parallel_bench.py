@@ -0,0 +1,54 @@
+"""Benchmark tests for bulk indicators over many symbols (serial, thread pool and process pool)"""
+import pytest
+from data_constants import generate_symbols
+from parallel import (
+    SYMBOL_COUNT,
+    SYMBOL_LENGTH,
+    TASKS,
+    WORKER_COUNTS,
+    ProcessRunner,
+    ThreadRunner,
+    record_throughput,
+    run_serial,
+    serial_seconds,
+)
+
+ROUNDS = 5
+
+@pytest.fixture(scope="module")
+def symbols():
+    return generate_symbols(SYMBOL_COUNT, SYMBOL_LENGTH)
+
+def record_symbols(benchmark, task, symbols, workers):
+    serial = serial_seconds(("multi_symbol", task), run_serial, task, symbols)
+    record_throughput(benchmark, len(symbols), workers, serial)
+
+@pytest.mark.parametrize("task", list(TASKS))
+class TestMultiSymbolThroughput:
+    def test_multi_symbol_serial(self, benchmark, symbols, task):
+        benchmark.group = f"multi_symbol_{task}"
+        result = benchmark.pedantic(run_serial, args=(task, symbols), rounds=ROUNDS, warmup_rounds=1)
+        record_symbols(benchmark, task, symbols, 1)
+        assert len(result) == len(symbols)
+
+    @pytest.mark.parametrize("workers", WORKER_COUNTS)
+    def test_multi_symbol_threads(self, benchmark, symbols, task, workers):
+        benchmark.group = f"multi_symbol_{task}"
+        runner = ThreadRunner(symbols, workers)
+        try:
+            result = benchmark.pedantic(runner.run, args=(task,), rounds=ROUNDS, warmup_rounds=1)
+        finally:
+            runner.close()
+        record_symbols(benchmark, task, symbols, workers)
+        assert result == run_serial(task, symbols)
+
+    @pytest.mark.parametrize("workers", WORKER_COUNTS)
+    def test_multi_symbol_processes(self, benchmark, symbols, task, workers):
+        benchmark.group = f"multi_symbol_{task}"
+        runner = ProcessRunner(symbols, workers)
+        try:
+            result = benchmark.pedantic(runner.run, args=(task,), rounds=ROUNDS, warmup_rounds=1)
+        finally:
+            runner.close()
+        record_symbols(benchmark, task, symbols, workers)
+        assert result == run_serial(task, symbols)
@@ -0,0 +1,57 @@
+"""Benchmark tests for the incremental peak/valley trackers (per-bar update vs. re-calling chart_trends on the growing series)"""
+import pytest
+from pytechnicalindicators import chart_trends
+from bench_stats import growing_series_setup, latency_info, split_ticks, tick_setup
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from peak_tracker import PeakTracker, ValleyTracker
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+PEAK_PERIOD = 50
+
+# name: (tracker, batch function)
+TRACKERS = {
+    "peaks": (PeakTracker, chart_trends.peaks),
+    "valleys": (ValleyTracker, chart_trends.valleys),
+}
+
+
+def run_tracker(tracker_class, prices, period, closest_neighbor):
+    return tracker_class(period, closest_neighbor).extend(prices)
+
+
+@pytest.mark.parametrize("kind", list(TRACKERS))
+@pytest.mark.parametrize("closest_neighbor", [1, 5, 10])
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestPeakTracker:
+    def test_tracker_full_series(self, benchmark, data_size, closest_neighbor, kind):
+        """Whole series through the tracker, same output as the batch call"""
+        benchmark.group = f"{kind}_incremental"
+        tracker_class, batch = TRACKERS[kind]
+        prices = get_test_data(data_size)['close']
+        period = min(PEAK_PERIOD, len(prices))
+        result = benchmark(run_tracker, tracker_class, prices, period, closest_neighbor)
+        assert result == [tuple(point) for point in batch(prices, period, closest_neighbor)]
+
+    def test_tracker_tick(self, benchmark, data_size, closest_neighbor, kind):
+        benchmark.group = f"{kind}_tick"
+        tracker_class, _ = TRACKERS[kind]
+        prices = get_test_data(data_size)['close']
+        history, ticks = split_ticks(prices)
+        tracker = tracker_class(min(PEAK_PERIOD, len(history)), closest_neighbor)
+        tracker.extend(history)
+        benchmark.pedantic(tracker.update, setup=tick_setup(ticks), rounds=len(ticks))
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert len(tracker.points) > 0
+
+    def test_batch_recompute_tick(self, benchmark, data_size, closest_neighbor, kind):
+        """chart_trends.peaks/valleys re-called on the whole history for every new bar"""
+        benchmark.group = f"{kind}_tick"
+        _, batch = TRACKERS[kind]
+        prices = get_test_data(data_size)['close']
+        history, ticks = split_ticks(prices)
+        period = min(PEAK_PERIOD, len(history))
+        setup = growing_series_setup(history, ticks, period, closest_neighbor)
+        result = benchmark.pedantic(batch, setup=setup, rounds=len(ticks))
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert isinstance(result, list)
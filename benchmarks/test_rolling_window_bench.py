@@ -0,0 +1,85 @@
+"""Benchmark tests for RollingWindow vs. list slicing when feeding windows to single.* functions"""
+import pytest
+from pytechnicalindicators import momentum_indicators
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from memory_profile import measure_memory
+from rolling_window import RollingWindow, sliding_windows
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+# Same window as the stochastic inputs of TestSlowStochastic
+WINDOW = 10
+# A list slice grows with the window, a memoryview slice doesn't
+WINDOW_WIDTHS = [10, 50, 200]
+
+# Both consume every window the same way (len) and keep none, only the construction differs
+def slice_windows(values, width):
+    total = 0
+    for i in range(len(values) - width + 1):
+        total += len(values[i : i + width])
+    return total
+
+def view_windows(values, width):
+    total = 0
+    for view in sliding_windows(values, width):
+        total += len(view)
+    return total
+
+def record_allocation(benchmark, make_window, windows, func, *args):
+    """tracemalloc bytes of one window object, times one per step, and the peak of a whole pass"""
+    _, window_info = measure_memory(make_window)
+    _, pass_info = measure_memory(func, *args)
+    benchmark.extra_info["windows"] = windows
+    benchmark.extra_info["bytes_per_window"] = window_info["retained_alloc_bytes"]
+    benchmark.extra_info["allocated_bytes"] = window_info["retained_alloc_bytes"] * windows
+    benchmark.extra_info["pass_peak_alloc_bytes"] = pass_info["peak_alloc_bytes"]
+
+@pytest.mark.parametrize("width", WINDOW_WIDTHS)
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestWindowConstruction:
+    @pytest.mark.benchmark(group="window_construction")
+    def test_slice_window_construction(self, benchmark, data_size, width):
+        closes = get_test_data(data_size)['close']
+        windows = len(closes) - width + 1
+        result = benchmark(slice_windows, closes, width)
+        record_allocation(benchmark, lambda: closes[:width], windows, slice_windows, closes, width)
+        assert result == windows * width
+
+    @pytest.mark.benchmark(group="window_construction")
+    def test_rolling_window_construction(self, benchmark, data_size, width):
+        closes = get_test_data(data_size)['close']
+        windows = len(closes) - width + 1
+        result = benchmark(view_windows, closes, width)
+        window = RollingWindow(width)
+        window.extend(closes[:width])
+        record_allocation(benchmark, window.view, windows, view_windows, closes, width)
+        assert result == windows * width
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestStochasticWindows:
+    @pytest.mark.benchmark(group="stoch_windows")
+    def test_slice_windows_stoch(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        closes = data['close']
+        result = benchmark(
+            lambda: [
+                momentum_indicators.single.stochastic_oscillator(closes[i : i + WINDOW])
+                for i in range(len(closes) - WINDOW + 1)
+            ]
+        )
+        assert len(result) == len(closes) - WINDOW + 1
+
+    @pytest.mark.benchmark(group="stoch_windows")
+    def test_rolling_window_stoch(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        closes = data['close']
+        result = benchmark(
+            lambda: [
+                momentum_indicators.single.stochastic_oscillator(view)
+                for view in sliding_windows(closes, WINDOW)
+            ]
+        )
+        assert result == [
+            momentum_indicators.single.stochastic_oscillator(closes[i : i + WINDOW])
+            for i in range(len(closes) - WINDOW + 1)
+        ]
@@ -0,0 +1,144 @@
+"""Scaling sweep benchmarks, fits time vs. input length and time vs. period per bulk indicator (run with --scaling)"""
+import warnings
+import pytest
+from pytechnicalindicators import (
+    candle_indicators,
+    momentum_indicators,
+    other_indicators,
+    standard_indicators,
+    strength_indicators,
+    volatility_indicators,
+)
+from data_constants import generate_ohlcv
+from scaling import (
+    LENGTH_LADDER,
+    PERIOD_LADDER,
+    PERIOD_SWEEP_LENGTH,
+    ScalingWarning,
+    scaling_report,
+    sweep,
+)
+
+ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
+dev_types = ["standard", "mean", "median", "mode", "ulcer"]
+
+BASE_PERIOD = 20
+
+pytestmark = pytest.mark.scaling
+
+_data = {}
+
+def ladder_data(length):
+    """Prefix of the synthetic series, generated once for the longest ladder length"""
+    if not _data:
+        _data.update(generate_ohlcv(max(LENGTH_LADDER + [PERIOD_SWEEP_LENGTH])))
+    return {key: values[:length] for key, values in _data.items()}
+
+def run_scaling(benchmark, make_call):
+    """
+    Benchmark `make_call(data, period)` at the top of the length ladder and store
+    the fitted length and period exponents in extra_info.
+    """
+    def at_length(length):
+        func, args = make_call(ladder_data(length), BASE_PERIOD)
+        return lambda: func(*args)
+
+    period_data = ladder_data(PERIOD_SWEEP_LENGTH)
+    def at_period(period):
+        func, args = make_call(period_data, period)
+        return lambda: func(*args)
+
+    benchmark.extra_info.update(
+        scaling_report("length", LENGTH_LADDER, sweep(at_length, LENGTH_LADDER))
+    )
+    benchmark.extra_info.update(
+        scaling_report("period", PERIOD_LADDER, sweep(at_period, PERIOD_LADDER))
+    )
+    for axis in ("length", "period"):
+        if benchmark.extra_info[f"{axis}_superlinear"]:
+            warnings.warn(
+                f"{benchmark.name} scales as {axis}^{benchmark.extra_info[f'{axis}_exponent']}",
+                ScalingWarning,
+            )
+
+    func, args = make_call(ladder_data(max(LENGTH_LADDER)), BASE_PERIOD)
+    return benchmark(func, *args)
+
+# Moving Constant Bands (full cross-product)
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("dev_type", dev_types)
+class TestMovingConstantBandsScaling:
+    @pytest.mark.benchmark(group="bands_bulk_scaling")
+    def test_bulk_bands_scaling(self, benchmark, ma_type, dev_type):
+        result = run_scaling(
+            benchmark,
+            lambda data, period: (
+                candle_indicators.bulk.moving_constant_bands,
+                (data['close'], ma_type, dev_type, 3.0, period),
+            ),
+        )
+        assert isinstance(result, list)
+
+# Relative Strength Index (all ma_types)
+@pytest.mark.parametrize("ma_type", ma_types)
+class TestRelativeStrengthIndexScaling:
+    @pytest.mark.benchmark(group="rsi_bulk_scaling")
+    def test_bulk_rsi_scaling(self, benchmark, ma_type):
+        result = run_scaling(
+            benchmark,
+            lambda data, period: (
+                momentum_indicators.bulk.relative_strength_index,
+                (data['close'], ma_type, period),
+            ),
+        )
+        assert isinstance(result, list)
+
+# Other bulk indicators taking a period, one representative call each
+BULK_CALLS = {
+    "mce": lambda data, period: (
+        candle_indicators.bulk.moving_constant_envelopes,
+        (data['close'], "simple", 3.0, period),
+    ),
+    "keltner": lambda data, period: (
+        candle_indicators.bulk.keltner_channel,
+        (data['high'], data['low'], data['close'], "simple", "simple", 2.0, period),
+    ),
+    "supertrend": lambda data, period: (
+        candle_indicators.bulk.supertrend,
+        (data['high'], data['low'], data['close'], "simple", 2.0, period),
+    ),
+    "donchian": lambda data, period: (
+        candle_indicators.bulk.donchian_channels,
+        (data['high'], data['low'], period),
+    ),
+    "cci": lambda data, period: (
+        momentum_indicators.bulk.commodity_channel_index,
+        (data['close'], "simple", "standard", 0.015, period),
+    ),
+    "mfi": lambda data, period: (
+        momentum_indicators.bulk.money_flow_index,
+        (data['close'], data['volume'], period),
+    ),
+    "atr": lambda data, period: (
+        other_indicators.bulk.average_true_range,
+        (data['close'], data['high'], data['low'], "simple", period),
+    ),
+    "sma": lambda data, period: (
+        standard_indicators.bulk.simple_moving_average,
+        (data['close'], period),
+    ),
+    "rvi": lambda data, period: (
+        strength_indicators.bulk.relative_vigor_index,
+        (data['open'], data['high'], data['low'], data['close'], "simple", period),
+    ),
+    "ulcer_index": lambda data, period: (
+        volatility_indicators.bulk.ulcer_index,
+        (data['close'], period),
+    ),
+}
+
+@pytest.mark.benchmark(group="bulk_scaling")
+@pytest.mark.parametrize("indicator", list(BULK_CALLS))
+def test_bulk_scaling(benchmark, indicator):
+    result = run_scaling(benchmark, BULK_CALLS[indicator])
+    assert isinstance(result, list)
@@ -1,9 +1,9 @@
 """Benchmark tests for standard_indicators (single and bulk, all dataset sizes)"""
 import pytest
 from pytechnicalindicators import standard_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
 
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 @pytest.mark.parametrize("data_size", data_sizes)
 class TestSimpleMovingAverage:
@@ -0,0 +1,40 @@
+"""Benchmark tests for the streaming engine (per-tick latency vs. bulk recompute of the full history)"""
+import pytest
+from bench_stats import latency_info, split_ticks, tick_setup
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from streaming import BulkRecompute, bars, default_engine
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+def split_history(data):
+    """(history, tick count), the last ticks of the data are streamed"""
+    history = {field: split_ticks(values)[0] for field, values in data.items()}
+    return history, len(data['close']) - len(history['close'])
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestStreamingEngine:
+    @pytest.mark.benchmark(group="streaming_tick")
+    def test_streaming_tick(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        history, ticks = split_history(data)
+        engine = default_engine()
+        for bar in bars(history):
+            engine.push(bar)
+        stream = bars(data, len(history['close']))
+        result = benchmark.pedantic(engine.push, setup=tick_setup(stream), rounds=ticks)
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert all(value is not None for value in result.values())
+        # Like for like with test_bulk_recompute_tick: the last bar gives the same values
+        previous = {field: values[:-1] for field, values in data.items()}
+        last_bar = next(bars(data, len(data['close']) - 1))
+        assert result == BulkRecompute(previous).push(last_bar)
+
+    @pytest.mark.benchmark(group="streaming_tick")
+    def test_bulk_recompute_tick(self, benchmark, data_size):
+        data = get_test_data(data_size)
+        history, ticks = split_history(data)
+        recompute = BulkRecompute(history)
+        stream = bars(data, len(history['close']))
+        result = benchmark.pedantic(recompute.push, setup=tick_setup(stream), rounds=ticks)
+        benchmark.extra_info.update(latency_info(benchmark))
+        assert set(result) == set(default_engine().indicators)
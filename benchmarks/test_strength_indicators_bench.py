@@ -1,10 +1,10 @@
 """Benchmark tests for strength_indicators (single and bulk, all dataset sizes and variations)"""
 import pytest
 from pytechnicalindicators import strength_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES, BENCHMARK_PERIODS, PERIOD_SWEEP_DATA_SIZE
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 class TestAccumulationDistribution:
     @pytest.mark.benchmark(group="ad_single")
@@ -90,3 +90,16 @@ class TestRelativeVigorIndex:
             data['open'], data['high'], data['low'], data['close'], ma_type, period
         )
         assert isinstance(result, list)
+
+# Period sweep (large data, shared period axis)
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestRelativeVigorIndexPeriods:
+    @pytest.mark.benchmark(group="rvi_bulk_period")
+    def test_bulk_rvi_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            strength_indicators.bulk.relative_vigor_index,
+            data['open'], data['high'], data['low'], data['close'], ma_type, period
+        )
+        assert isinstance(result, list)
@@ -0,0 +1,44 @@
+"""Benchmark tests for break_down_trends parameter grids (serial loop vs. process pool)"""
+import pytest
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
+from parallel import WORKER_COUNTS, ProcessPool, record_throughput, serial_seconds
+from trend_grid import evaluate_pool, evaluate_serial, parameter_grid
+
+data_sizes = BENCHMARK_DATA_SIZES
+
+ROUNDS = 3
+
+# 192 parameter sets around the TestBreakDownTrends values
+GRID = parameter_grid(
+    max_outliers=[0, 1, 2, 3],
+    soft_adj_r_squared_minimum=[0.5, 0.6, 0.7, 0.75, 0.8, 0.9],
+    hard_rmse_multiplier=[1.0, 1.25, 1.5, 2.0],
+    soft_durbin_watson_min=[1.5, 2.0],
+)
+
+
+def record_grid(benchmark, data_size, prices, workers):
+    serial = serial_seconds(("trend_grid", data_size), evaluate_serial, prices, GRID, rounds=ROUNDS)
+    record_throughput(benchmark, len(GRID), workers, serial, unit="evaluations")
+
+
+@pytest.mark.parametrize("data_size", data_sizes)
+class TestTrendGrid:
+    def test_grid_serial(self, benchmark, data_size):
+        benchmark.group = f"trend_grid_{data_size}"
+        prices = get_test_data(data_size)['close']
+        result = benchmark.pedantic(evaluate_serial, args=(prices, GRID), rounds=ROUNDS, warmup_rounds=1)
+        record_grid(benchmark, data_size, prices, 1)
+        assert len(result) == len(GRID)
+
+    @pytest.mark.parametrize("workers", WORKER_COUNTS)
+    def test_grid_processes(self, benchmark, data_size, workers):
+        benchmark.group = f"trend_grid_{data_size}"
+        prices = get_test_data(data_size)['close']
+        pool = ProcessPool(prices, workers)
+        try:
+            result = benchmark.pedantic(evaluate_pool, args=(pool, GRID), rounds=ROUNDS, warmup_rounds=1)
+        finally:
+            pool.close()
+        record_grid(benchmark, data_size, prices, workers)
+        assert result == evaluate_serial(prices, GRID)
@@ -1,11 +1,11 @@
 """Benchmark tests for trend_indicators (single and bulk, all dataset sizes and parameter variations)"""
 import pytest
 from pytechnicalindicators import trend_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
 positions = ["long", "short"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 class TestAroon:
     @pytest.mark.benchmark(group="aroon_up_single")
@@ -1,10 +1,10 @@
 """Benchmark tests for volatility_indicators (single and bulk, all dataset sizes and parameter variations)"""
 import pytest
 from pytechnicalindicators import volatility_indicators
-from data_constants import get_test_data
+from data_constants import get_test_data, BENCHMARK_DATA_SIZES, BENCHMARK_PERIODS, PERIOD_SWEEP_DATA_SIZE
 
 ma_types = ["simple", "smoothed", "exponential", "median", "mode"]
-data_sizes = ["small", "medium", "large"]
+data_sizes = BENCHMARK_DATA_SIZES
 
 class TestUlcerIndex:
     @pytest.mark.benchmark(group="ulcer_index_single")
@@ -35,3 +35,24 @@ class TestVolatilitySystem:
             data['high'], data['low'], data['close'], period, multiplier, ma_type
         )
         assert isinstance(result, list)
+
+# Period sweeps (large data, shared period axis)
+class TestUlcerIndexPeriods:
+    @pytest.mark.benchmark(group="ulcer_index_bulk_period")
+    @pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+    def test_bulk_ulcer_index_period(self, benchmark, period):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(volatility_indicators.bulk.ulcer_index, data['close'], period)
+        assert isinstance(result, list)
+
+@pytest.mark.parametrize("ma_type", ma_types)
+@pytest.mark.parametrize("period", BENCHMARK_PERIODS)
+class TestVolatilitySystemPeriods:
+    @pytest.mark.benchmark(group="volatility_system_bulk_period")
+    def test_bulk_volatility_system_period(self, benchmark, period, ma_type):
+        data = get_test_data(PERIOD_SWEEP_DATA_SIZE)
+        result = benchmark(
+            volatility_indicators.bulk.volatility_system,
+            data['high'], data['low'], data['close'], period, 2.0, ma_type
+        )
+        assert isinstance(result, list)
@@ -0,0 +1,49 @@
+"""
+Parameter grid search over chart_trends.break_down_trends for one series.
+
+Tuning evaluates hundreds of parameter sets per symbol, each one a full break_down_trends
+call (its regressions are fitted inside the native call, nothing is shared between parameter
+sets). evaluate_pool spreads the calls over a parallel.ProcessPool holding the series: it is sent to
+each worker once, only the parameter tuples and results cross process boundaries per grid.
+"""
+from itertools import product
+from pytechnicalindicators import chart_trends
+
+# Positional arguments of break_down_trends after the prices
+PARAMETER_NAMES = (
+    "max_outliers",
+    "soft_adj_r_squared_minimum",
+    "hard_adj_r_squared_minimum",
+    "soft_rmse_multiplier",
+    "hard_rmse_multiplier",
+    "soft_durbin_watson_min",
+    "soft_durbin_watson_max",
+    "hard_durbin_watson_min",
+    "hard_durbin_watson_max",
+)
+
+# The fixed values of TestBreakDownTrends, the soft RMSE multiplier follows soft_r2 - 0.2 there
+DEFAULT_PARAMETERS = dict(zip(PARAMETER_NAMES, (0, 0.75, 1.0, 0.55, 1.5, 2.0, 3.0, 2.0, 3.0)))
+
+
+def parameter_grid(**axes):
+    """Every combination of the given per-name value lists, the other names at DEFAULT_PARAMETERS"""
+    unknown = set(axes) - set(PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"unknown break_down_trends parameters: {', '.join(sorted(unknown))}")
+    values = [axes.get(name, [DEFAULT_PARAMETERS[name]]) for name in PARAMETER_NAMES]
+    return list(product(*values))
+
+
+def evaluate_parameters(prices, parameters):
+    return chart_trends.break_down_trends(prices, *parameters)
+
+
+def evaluate_serial(prices, grid):
+    """One break_down_trends call per grid entry in the calling process"""
+    return [evaluate_parameters(prices, parameters) for parameters in grid]
+
+
+def evaluate_pool(pool, grid):
+    """evaluate_serial on a parallel.ProcessPool created with the prices, results in grid order"""
+    return pool.map(evaluate_parameters, grid)
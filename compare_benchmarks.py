@@ -0,0 +1,129 @@
+"""
+Compare a fresh pytest-benchmark JSON against stored baselines and fail on regressions.
+
+Benchmarks are matched by `fullname`. New timings are first divided by a machine speed
+factor (the ratio of the `calibration` benchmark between the two runs, or the median
+ratio of all matched benchmarks), then a benchmark is a regression when it is
+significantly slower (Welch t on mean/stddev/rounds and a median shift larger than
+the IQR) and its normalised median ratio is above the threshold.
+
+Exit codes: 0 no regression, 1 at least one regression, 2 usage or setup error (bad
+arguments, no calibration benchmark), 3 nothing in the current run matched a baseline.
+"""
+import argparse
+import math
+import statistics
+import sys
+from benchmark_results import iter_benchmarks
+from benchmark_to_markdown_table import format_us
+
+CALIBRATION_GROUP = "calibration"
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_USAGE = 2
+EXIT_NOTHING_COMPARED = 3
+
+def index_by_fullname(paths):
+    benchmarks = {}
+    for path in paths:
+        for bm in iter_benchmarks(path):
+            benchmarks[bm["fullname"]] = bm
+    return benchmarks
+
+def speed_factor(baseline, current, mode):
+    """How much slower (>1) or faster (<1) the current machine is than the baseline one"""
+    if mode == "none":
+        return 1.0
+    if mode == "calibration":
+        base = [bm for bm in baseline.values() if bm.get("group") == CALIBRATION_GROUP]
+        new = [bm for bm in current.values() if bm.get("group") == CALIBRATION_GROUP]
+        if not base or not new:
+            raise ValueError(
+                "No calibration benchmark in both runs, run benchmarks/test_calibration_bench.py "
+                "with both or use --normalize median/none"
+            )
+        return new[0]["stats"]["median"] / base[0]["stats"]["median"]
+    ratios = [
+        current[name]["stats"]["median"] / bm["stats"]["median"]
+        for name, bm in baseline.items()
+        if name in current and bm.get("group") != CALIBRATION_GROUP
+    ]
+    return statistics.median(ratios) if ratios else 1.0
+
+def compare(base_stats, new_stats, factor, z_threshold):
+    """(normalised median ratio, welch t, significant) for one benchmark"""
+    scale = 1.0 / factor
+    base_mean, new_mean = base_stats["mean"], new_stats["mean"] * scale
+    base_sd, new_sd = base_stats.get("stddev", 0.0), new_stats.get("stddev", 0.0) * scale
+    standard_error = math.sqrt(
+        base_sd ** 2 / max(base_stats.get("rounds", 1), 1)
+        + new_sd ** 2 / max(new_stats.get("rounds", 1), 1)
+    )
+    t = (new_mean - base_mean) / standard_error if standard_error > 0 else math.inf * (new_mean - base_mean)
+    median_shift = new_stats["median"] * scale - base_stats["median"]
+    iqr = (base_stats.get("iqr", 0.0) + new_stats.get("iqr", 0.0) * scale) / 2
+    ratio = new_stats["median"] * scale / base_stats["median"]
+    significant = abs(t) > z_threshold and abs(median_shift) > iqr
+    return ratio, t, significant
+
+def compare_runs(baseline, current, factor, threshold, z_threshold):
+    """Rows (fullname, base median, new median normalised, ratio, t, status), status in regression/improvement/ok"""
+    rows = []
+    for name, base in sorted(baseline.items()):
+        if name not in current or base.get("group") == CALIBRATION_GROUP:
+            continue
+        new = current[name]
+        ratio, t, significant = compare(base["stats"], new["stats"], factor, z_threshold)
+        if significant and ratio > 1.0 + threshold:
+            status = "regression"
+        elif significant and ratio < 1.0 / (1.0 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, base["stats"]["median"], new["stats"]["median"] / factor, ratio, t, status))
+    return rows
+
+def make_report(rows, factor, unmatched):
+    lines = [
+        f"Speed factor (current / baseline): {factor:.3f}",
+        f"Compared: {len(rows)}, not in baseline: {unmatched}",
+        "",
+        "| Benchmark | Base median (µs) | New median, normalised (µs) | Ratio | t | Status |",
+        "|----|----|----|----|----|----|",
+    ]
+    for name, base, new, ratio, t, status in sorted(rows, key=lambda row: -row[3]):
+        if status == "ok":
+            continue
+        lines.append(f"| `{name}` | {format_us(base)} | {format_us(new)} | {ratio:.3f} | {t:.1f} | {status} |")
+    counts = {status: sum(1 for row in rows if row[5] == status) for status in ("regression", "improvement", "ok")}
+    lines += ["", ", ".join(f"{status}: {count}" for status, count in counts.items())]
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("current", help="pytest --benchmark-json output of the new run")
+    parser.add_argument("baselines", nargs="+", help="Baseline JSON file(s), e.g. results/rpi5_*_benchmark_results.json")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slow down, 0.10 = 10%% (default)")
+    parser.add_argument("--z", type=float, default=3.0, help="Welch t above which a difference is significant (default 3)")
+    parser.add_argument(
+        "--normalize", choices=["calibration", "median", "none"], default="calibration",
+        help="How to correct for machine speed (default: the calibration benchmark)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = index_by_fullname(args.baselines)
+    current = index_by_fullname([args.current])
+    try:
+        factor = speed_factor(baseline, current, args.normalize)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return EXIT_USAGE
+    rows = compare_runs(baseline, current, factor, args.threshold, args.z)
+    print(make_report(rows, factor, sum(1 for name in current if name not in baseline)))
+    if not rows:
+        print("Nothing in the current run matched a baseline benchmark", file=sys.stderr)
+        return EXIT_NOTHING_COMPARED
+    return EXIT_REGRESSION if any(row[5] == "regression" for row in rows) else EXIT_OK
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Multiplicative cost model over the parameter grids of a benchmark group.
+
+    time ~= base * f(ma_type) * g(dev_type) * ... * n^k
+
+fitted as ordinary least squares on log(median): one indicator column per non baseline value of
+every string parameter (ma_type, dev_type, ...), log(points) for the data size and log(value) for
+other numeric parameters (period, ...). Numeric parameters with values <= 0 (max_outliers=0, ...)
+have no log and get indicator columns like the strings. Every factor is reported with a 95% Student t
+confidence interval (runs - columns degrees of freedom), and the fit predicts combinations and sizes
+that were not run, e.g. one mode/ulcer cell plus the simple/standard row and column is enough to
+estimate the whole 25-way grid. Parameters that did not vary in the runs (a single data size, ...)
+can't be predicted for other values, nor can parameters the group doesn't have.
+
+Usage: python cost_model.py <results.json|.jsonl.gz>... [--group <group>] [--predict ma_type=mode,data_size=1m]
+"""
+import argparse
+import math
+import numpy as np
+from benchmark_results import data_size_points, iter_benchmarks
+from benchmark_to_markdown_table import BREAKDOWN_BASELINES, format_us
+
+# Two sided 95% quantiles of Student's t by degrees of freedom, t_95() extends them past 30
+T_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+Z_95 = 1.959964
+
+def t_95(dof):
+    """Two sided 95% Student t quantile, NaN without spare runs (Cornish-Fisher expansion above the table)"""
+    if dof < 1:
+        return float("nan")
+    if dof <= len(T_95):
+        return T_95[dof - 1]
+    z = Z_95
+    return (
+        z
+        + (z ** 3 + z) / (4 * dof)
+        + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+        + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+    )
+
+def collect(filenames):
+    """group -> [(params, median)]"""
+    groups = {}
+    for filename in filenames:
+        for bm in iter_benchmarks(filename):
+            groups.setdefault(bm.get("group") or "", []).append((bm.get("params") or {}, bm["stats"]["median"]))
+    return groups
+
+class CostModel:
+    """log-linear fit of the medians of one group, see the module docstring"""
+
+    def __init__(self, runs):
+        self.levels = {}
+        self.numeric = []
+        # Parameters with a single value in the runs, the model can't say anything about other values
+        self.constants = {}
+        for name in sorted({name for params, _ in runs for name in params}):
+            values = {params[name] for params, _ in runs if name in params}
+            if len(values) == 1:
+                self.constants[name] = next(iter(values))
+            elif name == "data_size" or all(isinstance(v, (int, float)) and v > 0 for v in values):
+                self.numeric.append(name)
+            else:
+                baseline = BREAKDOWN_BASELINES.get(name, min(values, key=str))
+                if baseline not in values:
+                    baseline = min(values, key=str)
+                self.levels[name] = [baseline] + sorted(values - {baseline}, key=str)
+        self.columns = ["base"] + [
+            f"{name}={value}" for name, values in self.levels.items() for value in values[1:]
+        ] + [f"{name} exponent" for name in self.numeric]
+        x = np.array([self.row(params) for params, _ in runs])
+        y = np.log([median for _, median in runs])
+        self.runs = len(runs)
+        self.coef, _, rank, _ = np.linalg.lstsq(x, y, rcond=None)
+        self.dof = self.runs - len(self.columns)
+        self.t = t_95(self.dof)
+        residuals = y - x @ self.coef
+        self.sigma2 = float(residuals @ residuals / self.dof) if self.dof > 0 else float("nan")
+        self.cov = self.sigma2 * np.linalg.pinv(x.T @ x)
+        self.r2 = 1.0 - float(residuals @ residuals) / float(((y - y.mean()) ** 2).sum()) if self.runs > 1 else float("nan")
+        self.identified = rank == len(self.columns)
+
+    @staticmethod
+    def _numeric(name, value):
+        points = data_size_points(value) if name == "data_size" else value
+        if not isinstance(points, (int, float)) or points <= 0:
+            raise ValueError(f"Can't use {name}={value!r} in the model")
+        return math.log(points)
+
+    def row(self, params):
+        for name, value in params.items():
+            if name in self.constants and value != self.constants[name]:
+                raise ValueError(
+                    f"{name} was not varied in the fitted runs (only {self.constants[name]!r}), can't predict {name}={value!r}"
+                )
+            if name not in self.constants and name not in self.levels and name not in self.numeric:
+                raise ValueError(f"Unknown parameter {name}, the model has {', '.join(self.parameters())}")
+        missing = [name for name in self.numeric if name not in params]
+        if missing:
+            raise ValueError(f"Missing numeric parameter(s) {', '.join(missing)}")
+        row = [1.0]
+        for name, values in self.levels.items():
+            value = params.get(name, values[0])
+            if value not in values:
+                raise ValueError(f"{name}={value!r} was not in the fitted grid")
+            row += [1.0 if value == level else 0.0 for level in values[1:]]
+        row += [self._numeric(name, params[name]) for name in self.numeric]
+        return row
+
+    def parameters(self):
+        return sorted(set(self.levels) | set(self.numeric) | set(self.constants))
+
+    def factors(self):
+        """[(column, estimate, low, high)], multiplicative factors except the exponents which are as fitted"""
+        errors = np.sqrt(np.maximum(np.diag(self.cov), 0.0))
+        rows = []
+        for column, coef, error in zip(self.columns, self.coef, errors):
+            low, high = coef - self.t * error, coef + self.t * error
+            if column.endswith(" exponent"):
+                rows.append((column, coef, low, high))
+            else:
+                rows.append((column, math.exp(coef), math.exp(low), math.exp(high)))
+        return rows
+
+    def predict(self, params):
+        """(seconds, low, high) for a parameter combination, including untested ones and sizes"""
+        x = np.array(self.row(params))
+        log_time = float(x @ self.coef)
+        error = math.sqrt(max(float(x @ self.cov @ x), 0.0))
+        return math.exp(log_time), math.exp(log_time - self.t * error), math.exp(log_time + self.t * error)
+
+def make_report(group, model):
+    lines = [
+        f"##### {group}",
+        "",
+        f"{model.runs} runs, R² {model.r2:.3f}"
+        + ("" if model.identified else ", some factors are not identified by the grid")
+        + ("" if model.dof > 0 else ", no spare runs for the intervals"),
+        "",
+        "| Factor | Estimate | 95% CI |",
+        "|----|----|----|",
+    ]
+    for column, estimate, low, high in model.factors():
+        if column == "base":
+            # Baseline values at one point / numeric parameter 1, can be tiny
+            lines.append(f"| base (µs) | {estimate * 1e6:.3g} | {low * 1e6:.3g} - {high * 1e6:.3g} |")
+        elif column.endswith(" exponent"):
+            lines.append(f"| {column} | {estimate:.3f} | {low:.3f} - {high:.3f} |")
+        else:
+            lines.append(f"| {column} | {estimate:.2f}x | {low:.2f}x - {high:.2f}x |")
+    return "\n".join(lines)
+
+def parse_params(text):
+    params = {}
+    for item in filter(None, text.split(",")):
+        name, _, value = item.partition("=")
+        params[name] = value if name == "data_size" else parse_value(value)
+    return params
+
+def parse_value(text):
+    """int, float or the string itself, like the parameter values in the result files"""
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit a multiplicative cost model per benchmark group")
+    parser.add_argument("results", nargs="+", help="Result files, .json or .jsonl.gz")
+    parser.add_argument("--group", action="append", help="Only these groups (default: every group with a grid)")
+    parser.add_argument("--predict", action="append", default=[], help="e.g. ma_type=mode,dev_type=ulcer,data_size=1m")
+    args = parser.parse_args(argv)
+
+    for group, runs in sorted(collect(args.results).items()):
+        if args.group and group not in args.group:
+            continue
+        try:
+            model = CostModel(runs)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            print(f"##### {group}\n\nNo model: {e}\n")
+            continue
+        if len(model.columns) == 1:
+            continue
+        print(make_report(group, model))
+        for text in args.predict:
+            try:
+                seconds, low, high = model.predict(parse_params(text))
+            except (KeyError, ValueError) as e:
+                print(f"\nPrediction for {text}: not possible ({e})")
+                continue
+            print(f"\nPrediction for {text}: {format_us(seconds)} µs (95% CI {format_us(low)} - {format_us(high)})")
+        print()
+
+if __name__ == "__main__":
+    main()
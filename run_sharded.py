@@ -0,0 +1,138 @@
+"""
+Run the benchmark suite sharded across CPU cores, one pinned pytest process per core.
+
+The collected test nodeids are dealt round robin to one shard per core. Each shard runs in its
+own pytest process pinned with os.sched_setaffinity to its core and writes its own
+--benchmark-json, the shards are then merged into one result file (readable by
+benchmark_to_markdown_table.py and compare_benchmarks.py) with the core of every benchmark in
+`extra_info.cpu_core`.
+
+Timings are only trustworthy on cores nothing else runs on: boot with e.g. `isolcpus=1-3` and
+pass `--cores 1-3`, keep core 0 for the system. Shared caches and memory bandwidth still couple
+the shards, check the per core summary (and compare a few cells across cores) before trusting a
+sharded run as much as a serial one.
+
+Usage: python run_sharded.py --cores 1-3 --output results/current.json [-- <pytest args>]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import pytest
+from benchmark_results import iter_benchmarks
+
+def parse_cores(text):
+    """'1-3,5' -> [1, 2, 3, 5]"""
+    cores = []
+    for part in filter(None, text.split(",")):
+        first, _, last = part.partition("-")
+        cores.extend(range(int(first), int(last or first) + 1))
+    return cores
+
+def default_cores():
+    """Every core this process may run on, except core 0 when there are others"""
+    cores = sorted(os.sched_getaffinity(0))
+    return cores[1:] if len(cores) > 1 and cores[0] == 0 else cores
+
+class _Collector:
+    """pytest plugin recording the collected nodeids and the test path arguments as pytest parsed them"""
+
+    def __init__(self):
+        self.nodeids = []
+        self.paths = []
+
+    def pytest_configure(self, config):
+        self.paths = list(config.getoption("file_or_dir") or [])
+
+    def pytest_collection_finish(self, session):
+        self.nodeids = [item.nodeid for item in session.items]
+
+def collect(pytest_args):
+    """(nodeids, test path arguments of pytest_args)"""
+    collector = _Collector()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        pytest.main(["--collect-only", "-q", *pytest_args], plugins=[collector])
+    return collector.nodeids, collector.paths
+
+def shard(nodeids, count):
+    return [nodeids[i::count] for i in range(count)]
+
+def options_only(pytest_args, paths):
+    """pytest_args without the test paths (the shards get their nodeids instead), option values are kept"""
+    remaining = list(paths)
+    options = []
+    for arg in pytest_args:
+        if remaining and arg == remaining[0]:
+            remaining.pop(0)
+        else:
+            options.append(arg)
+    return options
+
+def run_shards(shards, cores, pytest_args, directory):
+    """Start one pinned pytest per shard (pytest_args without test paths), returns [(core, json path, return code)]"""
+    processes = []
+    for core, nodeids in zip(cores, shards):
+        if not nodeids:
+            continue
+        args_file = os.path.join(directory, f"shard_{core}.txt")
+        with open(args_file, "w") as f:
+            f.write("\n".join(nodeids) + "\n")
+        json_path = os.path.join(directory, f"shard_{core}.json")
+        process = subprocess.Popen(
+            # The shard's --benchmark-json last, it wins over one in pytest_args
+            [sys.executable, "-m", "pytest", f"@{args_file}", *pytest_args, f"--benchmark-json={json_path}"],
+            preexec_fn=lambda core=core: os.sched_setaffinity(0, {core}),
+            stdout=subprocess.DEVNULL,
+        )
+        processes.append((core, json_path, process))
+    return [(core, json_path, process.wait()) for core, json_path, process in processes]
+
+def merge(shard_results, output):
+    """Merge the shard JSON files into `output`, returns {core: benchmark count}"""
+    merged, counts = None, {}
+    for core, json_path, _ in shard_results:
+        if not os.path.exists(json_path):
+            continue
+        header = {}
+        records = list(iter_benchmarks(json_path, header))
+        for record in records:
+            record.setdefault("extra_info", {})["cpu_core"] = core
+        counts[core] = len(records)
+        if merged is None:
+            merged = dict(header, benchmarks=[])
+            merged["machine_info"]["cpu_cores"] = [core for core, _, _ in shard_results]
+        merged["benchmarks"].extend(records)
+    if merged is not None:
+        with open(output, "w") as f:
+            json.dump(merged, f, indent=4)
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmarks sharded across pinned CPU cores")
+    parser.add_argument("--cores", type=parse_cores, default=None, help="e.g. 1-3 (default: all but core 0)")
+    parser.add_argument("--output", default="results/sharded.json", help="Merged --benchmark-json output")
+    parser.add_argument("pytest_args", nargs="*", help="Passed to pytest, after --")
+    args = parser.parse_args(argv)
+
+    cores = args.cores or default_cores()
+    nodeids, paths = collect(args.pytest_args)
+    if not nodeids:
+        print("No benchmarks collected")
+        return 1
+    print(f"{len(nodeids)} benchmarks on cores {', '.join(map(str, cores))}")
+    with tempfile.TemporaryDirectory() as directory:
+        shard_results = run_shards(
+            shard(nodeids, len(cores)), cores, options_only(args.pytest_args, paths), directory
+        )
+        counts = merge(shard_results, args.output)
+    for core, _, returncode in shard_results:
+        print(f"core {core}: {counts.get(core, 0)} benchmarks, pytest exit code {returncode}")
+    print(f"Wrote {args.output}")
+    return max((returncode for _, _, returncode in shard_results), default=0)
+
+if __name__ == "__main__":
+    sys.exit(main())